@@ -10,11 +10,64 @@
 """
 
 import os
+import sys
 import json
 import logging
-from typing import Dict, List, Any, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, List, Any, Tuple, Set, Iterable, Iterator
 from pathlib import Path
 
+# orjson이 설치되어 있으면 사용 (C 구현으로 대용량 JSON 파싱이 훨씬 빠름)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pandas가 설치되어 있으면 검증/중복 제거를 벡터화 연산으로 처리
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# ijson이 설치되어 있으면 대용량 낱알 파일을 스트리밍 방식으로 파싱
+# (C 기반 yajl2_c 백엔드가 있으면 우선 사용 - 순수 파이썬 백엔드보다 수 배 빠름)
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+# 이 크기 이하의 파일은 전체 로드(orjson)가 스트리밍 파서보다 빠름
+STREAMING_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# 핫 루프에서 사용하는 필드 키를 명시적으로 인터닝
+# (json/orjson이 만든 키 문자열은 자동 인터닝되지 않으므로, 인터닝된 키를
+#  사용하면 레코드마다 키 참조가 공유되고 딕셔너리 조회가 포인터 비교로 끝남)
+_ITEM_SEQ = sys.intern('ITEM_SEQ')
+_ITEM_NAME = sys.intern('ITEM_NAME')
+_ENTP_NAME = sys.intern('ENTP_NAME')
+_CHART = sys.intern('CHART')
+_SOURCE = sys.intern('_source')
+_MATCH_TYPE = sys.intern('_matchType')
+_NEEDS_ADDITIONAL_INFO = sys.intern('_needsAdditionalInfo')
+
+
+def _clean(s: Any) -> str:
+    """
+    문자열 앞뒤 공백 제거 함수 (이미 깨끗한 문자열은 그대로 반환)
+
+    str.strip()은 결과가 같아도 항상 새 문자열을 할당하므로, 공백이
+    없는 값은 할당 없이 원본을 돌려줘 레코드당 불필요한 할당을 줄임
+    """
+    if not s:
+        return ''
+    if s[0].isspace() or s[-1].isspace():
+        return s.strip()
+    return s
+
 # 프로젝트 루트 디렉토리 설정 (상대 경로 사용)
 PROJECT_ROOT = Path(__file__).parent.parent.absolute()
 
@@ -51,18 +104,20 @@ def load_json_file(file_path: Path) -> List[Dict[str, Any]]:
     """
     try:
         logger.info(f"파일 로드 중: {file_path}")
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+        # orjson은 바이트 입력을 받으므로 텍스트 모드 대신 바이트로 읽음
+        raw = file_path.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw.decode('utf-8'))
+
         # 데이터가 리스트가 아니면 리스트로 변환
         if not isinstance(data, list):
             data = [data]
-            
+
         return data
     except FileNotFoundError:
         logger.error(f"파일을 찾을 수 없습니다: {file_path}")
         raise
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, ValueError):
+        # orjson.JSONDecodeError는 ValueError의 하위 클래스
         logger.error(f"JSON 파싱 오류: {file_path}")
         raise
     except Exception as e:
@@ -70,14 +125,35 @@ def load_json_file(file_path: Path) -> List[Dict[str, Any]]:
         raise
 
 
+def iter_json_array(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    JSON 배열 파일을 항목 단위로 순회하는 제너레이터
+
+    ijson으로 파일을 증분 파싱하므로 전체 리스트를 메모리에 올리지 않음
+    (대용량 낱알 파일 전용 — 호출 전 ijson 설치 여부를 확인할 것)
+
+    Args:
+        file_path: 순회할 JSON 배열 파일 경로
+
+    Yields:
+        배열의 개별 레코드
+    """
+    logger.info(f"파일 스트리밍 로드 중: {file_path}")
+    with open(file_path, 'rb') as f:
+        yield from ijson.items(f, 'item')
+
+
 def validate_and_preprocess_data(data_list: List[Dict[str, Any]], source_type: str) -> List[Dict[str, Any]]:
     """
     데이터 검증 및 전처리 함수
-    
+
+    주의: 복사 비용을 줄이기 위해 입력 리스트의 레코드를 제자리에서
+    수정하므로, 호출자가 원본 데이터를 따로 보존해야 한다면 복사본을 전달할 것
+
     Args:
         data_list: 전처리할 데이터 리스트
         source_type: 데이터 소스 유형 ('approval' 또는 'pill')
-        
+
     Returns:
         전처리된 데이터 리스트
     """
@@ -86,15 +162,55 @@ def validate_and_preprocess_data(data_list: List[Dict[str, Any]], source_type: s
     if not data_list:
         logger.warning(f"{source_type} 데이터가 비어있습니다.")
         return []
-    
+
+    # pandas 사용 가능 시: 벡터화된 정규화/중복 제거 경로
+    if pd is not None:
+        df = pd.DataFrame(data_list)
+        initial_count = len(df)
+
+        if 'ITEM_SEQ' not in df.columns:
+            logger.warning(f"{source_type} 데이터에 ITEM_SEQ 컬럼이 없습니다.")
+            return []
+
+        # ITEM_SEQ를 문자열로 통일하고 누락 항목 필터링
+        df['ITEM_SEQ'] = df['ITEM_SEQ'].fillna('').astype(str)
+        df = df[df['ITEM_SEQ'] != '']
+        missing_count = initial_count - len(df)
+        if missing_count > 0:
+            logger.warning(f"ITEM_SEQ가 없는 {source_type} 항목 {missing_count}개가 필터링됨")
+
+        # 중복 ITEM_SEQ 제거 (첫 항목 유지)
+        before_dedup = len(df)
+        df = df.drop_duplicates('ITEM_SEQ')
+        duplicate_count = before_dedup - len(df)
+        if duplicate_count > 0:
+            logger.warning(f"중복된 ITEM_SEQ {duplicate_count}개가 필터링됨")
+
+        # 기본 필드 표준화 (C 레벨 문자열 연산)
+        for col in ('ITEM_NAME', 'ENTP_NAME', 'CHART'):
+            if col in df.columns:
+                df[col] = df[col].fillna('').astype(str).str.strip()
+            else:
+                df[col] = ''
+
+        processed_records = df.to_dict('records')
+        logger.info(f"{source_type} 데이터 전처리 완료: {len(processed_records)}개 유효 항목")
+        return processed_records
+
+    # pandas 미설치 환경을 위한 순수 파이썬 경로
     # 중복 ITEM_SEQ 확인을 위한 세트
     seen_item_seqs: Set[str] = set()
     processed_data = []
-    
+
+    # 필터링 사유별 집계 (레코드마다 logger.warning을 호출하면 포맷팅과
+    # 핸들러 락 비용이 누적되므로 루프 종료 후 한 번만 경고를 출력)
+    missing_count = 0
+    duplicate_count = 0
+
     for item in data_list:
         # ITEM_SEQ 확인
         if 'ITEM_SEQ' not in item or not item['ITEM_SEQ']:
-            logger.warning(f"ITEM_SEQ가 없는 {source_type} 항목이 필터링됨")
+            missing_count += 1
             continue
         
         # ITEM_SEQ를 문자열로 통일
@@ -102,34 +218,45 @@ def validate_and_preprocess_data(data_list: List[Dict[str, Any]], source_type: s
         
         # 중복 체크
         if item_seq in seen_item_seqs:
-            logger.warning(f"중복된 ITEM_SEQ 발견: {item_seq}")
+            duplicate_count += 1
+            logger.debug(f"중복된 ITEM_SEQ 발견: {item_seq}")
             continue
         
         seen_item_seqs.add(item_seq)
-        
-        # 기본 필드 표준화
-        processed_item = {
-            **item,
-            'ITEM_SEQ': item_seq,
-            'ITEM_NAME': item.get('ITEM_NAME', '').strip(),
-            'ENTP_NAME': item.get('ENTP_NAME', '').strip(),
-            'CHART': item.get('CHART', '').strip()
-        }
-        
-        processed_data.append(processed_item)
-    
+
+        # 기본 필드 표준화: 값이 실제로 바뀐 필드만 제자리 갱신
+        # ({**item, ...} 재구성 제거 — 대부분의 레코드는 이미 정규화된 상태라
+        #  딕셔너리 복사 자체가 낭비이므로 원본 레코드를 그대로 재사용)
+        if item[_ITEM_SEQ] is not item_seq:
+            item[_ITEM_SEQ] = item_seq
+        for key in (_ITEM_NAME, _ENTP_NAME, _CHART):
+            original = item.get(key, '')
+            cleaned = _clean(original)
+            if cleaned is not original:
+                item[key] = cleaned
+
+        processed_data.append(item)
+
+    if missing_count > 0 or duplicate_count > 0:
+        logger.warning(
+            f"{source_type} 항목 필터링: ITEM_SEQ 누락 {missing_count}개, 중복 {duplicate_count}개"
+        )
     logger.info(f"{source_type} 데이터 전처리 완료: {len(processed_data)}개 유효 항목")
     return processed_data
 
 
-def merge_drug_data(approval_data: List[Dict[str, Any]], pill_data: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+def process_and_merge(approval_raw: List[Dict[str, Any]], pill_raw: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
     """
-    허가정보와 낱알정보 병합 함수
-    
+    허가정보와 낱알정보를 전처리와 동시에 병합하는 함수
+
+    허가정보는 전처리 후 ITEM_SEQ 맵으로 변환하고, 낱알정보는 별도의
+    전처리 리스트를 만들지 않고 정규화 직후 바로 병합 분기로 보냄
+    (낱알 데이터를 두 번 순회하지 않아 중간 리스트 메모리가 절약됨)
+
     Args:
-        approval_data: 허가정보 데이터 리스트
-        pill_data: 낱알정보 데이터 리스트
-        
+        approval_raw: 허가정보 원본 데이터 리스트
+        pill_raw: 낱알정보 원본 데이터 (리스트 또는 스트리밍 제너레이터)
+
     Returns:
         병합 결과 딕셔너리 (merged, unmatchedPills, unmatchedApprovals 키 포함)
     """
@@ -140,48 +267,92 @@ def merge_drug_data(approval_data: List[Dict[str, Any]], pill_data: List[Dict[st
         'unmatchedApprovals': [] # 낱알정보에 없는 허가정보
     }
 
-    # 허가정보를 ITEM_SEQ를 키로 하는 딕셔너리로 변환하여 검색 효율 향상
-    approval_map = {item['ITEM_SEQ']: item for item in approval_data}
-    
-    # 처리 여부 추적을 위한 세트
-    processed_approvals = set()
-    
-    # 낱알정보 순회하며 매칭 찾기
-    for pill in pill_data:
-        item_seq = pill['ITEM_SEQ']
-        
-        if item_seq in approval_map:
+    # 허가정보 전처리 후 ITEM_SEQ를 키로 하는 딕셔너리로 변환하여 검색 효율 향상
+    # (itemgetter/zip/dict 조합은 항목별 파이썬 프레임 없이 C 레벨에서 순회함)
+    approval_data = validate_and_preprocess_data(approval_raw, '허가정보')
+    get_seq = itemgetter(_ITEM_SEQ)
+    approval_map = dict(zip(map(get_seq, approval_data), approval_data))
+
+    # 낱알정보 중복 확인을 위한 세트
+    seen_pill_seqs: Set[str] = set()
+
+    # 필터링 사유별 집계 (루프 종료 후 한 번만 경고 출력)
+    missing_count = 0
+    duplicate_count = 0
+
+    # 핫 루프에서 반복되는 속성/첨자 조회를 지역 변수로 바인딩
+    # (LOAD_FAST가 LOAD_ATTR/BINARY_SUBSCR보다 훨씬 저렴함)
+    merged_append = result['merged'].append
+    unmatched_pills_append = result['unmatchedPills'].append
+    approval_pop = approval_map.pop
+    seen_add = seen_pill_seqs.add
+
+    # 낱알정보 순회: 정규화와 매칭을 한 번의 순회로 처리
+    logger.info('낱알정보 데이터 검증 및 전처리 중...')
+    for raw_pill in pill_raw:
+        # ITEM_SEQ 확인
+        if 'ITEM_SEQ' not in raw_pill or not raw_pill['ITEM_SEQ']:
+            missing_count += 1
+            continue
+
+        # ITEM_SEQ를 문자열로 통일
+        item_seq = str(raw_pill['ITEM_SEQ'])
+
+        # 중복 체크
+        if item_seq in seen_pill_seqs:
+            duplicate_count += 1
+            logger.debug(f"중복된 ITEM_SEQ 발견: {item_seq}")
+            continue
+
+        seen_add(item_seq)
+
+        # 기본 필드 표준화: 값이 실제로 바뀐 필드만 제자리 갱신
+        # (딕셔너리 재구성 없이 원본 레코드를 그대로 재사용)
+        if raw_pill[_ITEM_SEQ] is not item_seq:
+            raw_pill[_ITEM_SEQ] = item_seq
+        for key in (_ITEM_NAME, _ENTP_NAME, _CHART):
+            original = raw_pill.get(key, '')
+            cleaned = _clean(original)
+            if cleaned is not original:
+                raw_pill[key] = cleaned
+        pill = raw_pill
+
+        # 매칭된 허가정보는 맵에서 꺼내어 제거 — 별도의 처리 추적 세트 없이
+        # 루프 종료 후 approval_map에는 미매칭 허가정보만 남음
+        approval_item = approval_pop(item_seq, None)
+        if approval_item is not None:
             # 매칭된 경우: 데이터 병합
-            approval_item = approval_map[item_seq]
-            
             # 중복 필드 중 허가정보 우선 처리
-            merged_data = {
-                **approval_item,  # 허가정보 기본 데이터
-                **pill,           # 낱알정보 추가
-                
-                # 중복 필드 처리 (허가정보 우선)
-                'ITEM_NAME': approval_item.get('ITEM_NAME') or pill.get('ITEM_NAME', ''),
-                'ENTP_NAME': approval_item.get('ENTP_NAME') or pill.get('ENTP_NAME', ''),
-                'CHART': approval_item.get('CHART') or pill.get('CHART', ''),
-                
-                # 출처 표시
-                '_source': 'both',
-                '_matchType': 'exact_match_by_ITEM_SEQ'
-            }
-            
-            result['merged'].append(merged_data)
-            processed_approvals.add(item_seq)
+            # 언패킹({**a, **b}) 대신 복사 후 제자리 갱신으로 중간 딕셔너리 할당 제거
+            # (approval_item 자체는 변경하지 않아 unmatchedApprovals 수집에 영향 없음)
+            merged_data = approval_item.copy()  # 허가정보 기본 데이터
+            merged_data.update(pill)            # 낱알정보 추가
+
+            # 중복 필드 처리 (허가정보 우선)
+            merged_data[_ITEM_NAME] = approval_item.get(_ITEM_NAME) or pill.get(_ITEM_NAME, '')
+            merged_data[_ENTP_NAME] = approval_item.get(_ENTP_NAME) or pill.get(_ENTP_NAME, '')
+            merged_data[_CHART] = approval_item.get(_CHART) or pill.get(_CHART, '')
+
+            # 출처 표시
+            merged_data[_SOURCE] = 'both'
+            merged_data[_MATCH_TYPE] = 'exact_match_by_ITEM_SEQ'
+
+            merged_append(merged_data)
         else:
             # 매칭되지 않은 낱알정보
-            pill['_needsAdditionalInfo'] = True
-            pill['_source'] = 'pill_only'
-            result['unmatchedPills'].append(pill)
+            pill[_NEEDS_ADDITIONAL_INFO] = True
+            pill[_SOURCE] = 'pill_only'
+            unmatched_pills_append(pill)
     
-    # 매칭되지 않은 허가정보 수집
-    for item_seq, approval in approval_map.items():
-        if item_seq not in processed_approvals:
-            approval['_source'] = 'approval_only'
-            result['unmatchedApprovals'].append(approval)
+    if missing_count > 0 or duplicate_count > 0:
+        logger.warning(
+            f"낱알정보 항목 필터링: ITEM_SEQ 누락 {missing_count}개, 중복 {duplicate_count}개"
+        )
+
+    # 매칭되지 않은 허가정보 수집 (pop 이후 맵에 남은 항목이 곧 미매칭분)
+    for approval in approval_map.values():
+        approval[_SOURCE] = 'approval_only'
+        result['unmatchedApprovals'].append(approval)
     
     return result
 
@@ -217,32 +388,78 @@ def analyze_results(merge_result: Dict[str, List[Dict[str, Any]]]) -> Dict[str,
     }
 
 
-def save_results(merge_result: Dict[str, List[Dict[str, Any]]]) -> None:
+def _write_json(path: Path, obj: Any) -> None:
+    """
+    JSON 파일 쓰기 함수 (orjson 사용 가능 시 바이트로 직렬화)
+
+    Args:
+        path: 저장할 파일 경로
+        obj: 직렬화할 객체
+    """
+    if orjson:
+        # orjson의 indent는 2칸 고정으로 기존 출력 형식과 동일
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+
+
+def _stream_json_array(path: Path, items: List[Dict[str, Any]]) -> None:
+    """
+    JSON 배열을 항목 단위로 직렬화하며 순차 기록하는 함수
+
+    전체 리스트를 한 번에 직렬화하지 않으므로 직렬화 중 메모리 사용이
+    항목 1개 수준으로 유지됨 (항목별 JSON은 들여쓰기 없이 기록)
+
+    Args:
+        path: 저장할 파일 경로
+        items: 기록할 레코드 리스트
+    """
+    if orjson:
+        dumps = orjson.dumps
+    else:
+        dumps = lambda obj: json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    with open(path, 'wb') as f:
+        f.write(b'[\n')
+        first = True
+        for item in items:
+            if not first:
+                f.write(b',\n')
+            f.write(dumps(item))
+            first = False
+        f.write(b'\n]')
+
+
+def save_results(merge_result: Dict[str, List[Dict[str, Any]]], pretty: bool = False) -> None:
     """
     결과 저장 함수
-    
+
     Args:
         merge_result: 병합 결과 딕셔너리
+        pretty: True면 들여쓰기된 JSON으로 저장 (작은 출력 확인용),
+                False면 항목 단위 스트리밍 기록 (대용량 기본값)
     """
     logger.info('결과 파일 저장 중...')
-    
+
     # 출력 디렉토리 생성
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
-    # 병합된 데이터 저장
-    with open(MERGED_OUTPUT_PATH, 'w', encoding='utf-8') as f:
-        json.dump(merge_result['merged'], f, ensure_ascii=False, indent=2)
-    logger.info(f"병합된 데이터 저장 완료: {MERGED_OUTPUT_PATH} ({len(merge_result['merged'])}개 항목)")
-    
-    # 미매칭 낱알정보 저장
-    with open(UNMATCHED_PILLS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(merge_result['unmatchedPills'], f, ensure_ascii=False, indent=2)
-    logger.info(f"미매칭 낱알정보 저장 완료: {UNMATCHED_PILLS_PATH} ({len(merge_result['unmatchedPills'])}개 항목)")
-    
-    # 미매칭 허가정보 저장
-    with open(UNMATCHED_APPROVALS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(merge_result['unmatchedApprovals'], f, ensure_ascii=False, indent=2)
-    logger.info(f"미매칭 허가정보 저장 완료: {UNMATCHED_APPROVALS_PATH} ({len(merge_result['unmatchedApprovals'])}개 항목)")
+
+    write = _write_json if pretty else _stream_json_array
+
+    # 세 출력 파일은 서로 독립적이고 쓰기는 I/O 바운드이므로 (orjson 직렬화도
+    # GIL을 해제함) 스레드로 동시에 저장
+    targets = [
+        (MERGED_OUTPUT_PATH, merge_result['merged'], '병합된 데이터'),
+        (UNMATCHED_PILLS_PATH, merge_result['unmatchedPills'], '미매칭 낱알정보'),
+        (UNMATCHED_APPROVALS_PATH, merge_result['unmatchedApprovals'], '미매칭 허가정보'),
+    ]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [(executor.submit(write, path, items), path, items, label)
+                   for path, items, label in targets]
+        for future, path, items, label in futures:
+            future.result()
+            logger.info(f"{label} 저장 완료: {path} ({len(items)}개 항목)")
 
 
 def main() -> Dict[str, Any]:
@@ -257,28 +474,42 @@ def main() -> Dict[str, Any]:
     
     try:
         # 1. 데이터 로드
+        # 낱알 파일이 임계 크기를 넘고 ijson이 있으면 스트리밍 파싱으로
+        # 전체 리스트 메모리 사용을 피함 (작은 파일은 orjson 전체 로드가 빠름)
         logger.info('데이터 파일 로드 중...')
-        approval_data_raw = load_json_file(APPROVAL_DATA_PATH)
-        pill_data_raw = load_json_file(PILL_DATA_PATH)
-        
-        logger.info(f"로드된 허가정보 데이터: {len(approval_data_raw)}개 항목")
-        logger.info(f"로드된 낱알정보 데이터: {len(pill_data_raw)}개 항목")
-        
-        # 2. 데이터 검증 및 전처리
-        approval_data = validate_and_preprocess_data(approval_data_raw, '허가정보')
-        pill_data = validate_and_preprocess_data(pill_data_raw, '낱알정보')
-        
-        # 3. 데이터 병합
+        stream_pills = (
+            ijson is not None
+            and PILL_DATA_PATH.exists()
+            and PILL_DATA_PATH.stat().st_size > STREAMING_THRESHOLD_BYTES
+        )
+        if stream_pills:
+            approval_data_raw = load_json_file(APPROVAL_DATA_PATH)
+            pill_data_raw = iter_json_array(PILL_DATA_PATH)
+            logger.info(f"로드된 허가정보 데이터: {len(approval_data_raw)}개 항목")
+            logger.info("낱알정보 데이터: 스트리밍 모드로 순회")
+        else:
+            # 파일 읽기는 블로킹 I/O이고 orjson 파싱은 GIL을 해제하므로
+            # 두 파일을 스레드로 동시에 로드
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                approval_future = executor.submit(load_json_file, APPROVAL_DATA_PATH)
+                pill_future = executor.submit(load_json_file, PILL_DATA_PATH)
+                approval_data_raw = approval_future.result()
+                pill_data_raw = pill_future.result()
+
+            logger.info(f"로드된 허가정보 데이터: {len(approval_data_raw)}개 항목")
+            logger.info(f"로드된 낱알정보 데이터: {len(pill_data_raw)}개 항목")
+
+        # 2. 데이터 검증/전처리와 병합을 한 번의 순회로 처리
         logger.info('ITEM_SEQ를 기준으로 데이터 병합 중...')
-        merge_result = merge_drug_data(approval_data, pill_data)
-        
-        # 4. 분석 결과 출력
+        merge_result = process_and_merge(approval_data_raw, pill_data_raw)
+
+        # 3. 분석 결과 출력
         analysis = analyze_results(merge_result)
         logger.info('=== 병합 결과 분석 ===')
         for key, value in analysis.items():
             logger.info(f"{key}: {value}")
         
-        # 5. 결과 저장
+        # 4. 결과 저장
         save_results(merge_result)
         
         logger.info('의약품 데이터 병합 프로세스 완료!')
@@ -1,12 +1,52 @@
 import os
+import io
 import requests
 import json
 import xml.etree.ElementTree as ET
 import re
 import html
 import time
+import asyncio
+import sqlite3
+import hashlib
+import logging
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
-from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson이 설치되어 있으면 사용 (수백 MB 결과 직렬화가 stdlib json보다 수 배 빠름)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# aiohttp가 설치되어 있으면 totalCount 파악 후 나머지 페이지를 동시에 수집
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# lxml이 설치되어 있으면 C 기반 파서 사용 (stdlib ET보다 수 배 빠르고,
+# recover 모드가 未이스케이프 & / 닫히지 않은 태그 등을 스스로 복구함)
+try:
+    from lxml import etree as lxml_etree
+    # lxml 파서 객체는 재사용 가능 — 호출마다 생성 비용을 내지 않도록 모듈 레벨에 유지
+    LXML_PARSER = lxml_etree.XMLParser(recover=True, huge_tree=True, resolve_entities=False)
+except ImportError:
+    lxml_etree = None
+    LXML_PARSER = None
+
+# HTTP 세션: keep-alive로 페이지마다 TCP 연결을 새로 맺지 않고,
+# 일시적 오류(429/5xx)는 지수 백오프로 자동 재시도하며, gzip 압축을 요청
+session = requests.Session()
+session.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
 
 # 환경 변수 파일 경로
 dotenv_path = os.path.join(os.path.dirname(__file__), "..", "configs", ".env")
@@ -20,111 +60,223 @@ API_KEY = os.getenv("DATA_PORTAL_API_KEY_DECODED")  # .env 파일에서 API 키
 
 # 출력 파일 경로
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-RAW_OUTPUT_FILE = os.path.join(ROOT_DIR, "data", "raw", "drug_approval_data.json")
+RAW_OUTPUT_FILE = os.path.join(ROOT_DIR, "data", "raw", "drug_approval_data.jsonl")
+PARSE_CACHE_FILE = os.path.join(ROOT_DIR, "data", "cache", "parsed_xml_cache.db")
+
 PROCESSED_OUTPUT_FILE = os.path.join(ROOT_DIR, "data", "processed", "drug_approval_data_processed.json")
 
-# 필요한 필드 목록
-REQUIRED_FIELDS = [
-    "ITEM_SEQ", "ITEM_NAME", "ENTP_NAME", "ETC_OTC_CODE", "ETC_OTC_NAME", "CHART", 
+# 항목 단위 진단 로그 (기본 비활성, 필요 시 DEBUG 레벨로 활성화)
+logger = logging.getLogger(__name__)
+
+# 필요한 필드 목록 (행마다 순회하므로 튜플로 고정)
+REQUIRED_FIELDS = (
+    "ITEM_SEQ", "ITEM_NAME", "ENTP_NAME", "ETC_OTC_CODE", "ETC_OTC_NAME", "CHART",
     "EE_DOC_DATA", "UD_DOC_DATA", "NB_DOC_DATA", "STORAGE_METHOD", "VALID_TERM", "CANCEL_DATE"
-]
+)
+
+# XML 문서 필드 목록 (파싱 대상)
+DOC_FIELDS = ('EE_DOC_DATA', 'UD_DOC_DATA', 'NB_DOC_DATA')
+
+# 처리 결과에서 "의미 있는 내용" 판단에 쓰는 텍스트 필드
+_CONTENT_FIELDS = ('EFFECTIVENESS', 'USAGE_DOSAGE', 'PRECAUTIONS')
+
+# 자주 사용하는 정규식은 모듈 레벨에서 한 번만 컴파일
+# (re 모듈의 내부 캐시는 크기가 작고 호출마다 패턴 문자열 해싱 비용이 듦)
+_RE_SUB = re.compile(r'<sub>(.*?)</sub>')
+_RE_SUP = re.compile(r'<sup>(.*?)</sup>')
+_RE_TAG = re.compile(r'<[^>]+>')
+_RE_ANY_TAG = re.compile(r'<[^>]*>')
+_RE_SPACES = re.compile(r' +')
+
+# 문자 단위 정리 테이블: \r 제거, \t -> 공백 (str.translate는 C 수준 단일 패스)
+_CLEAN_TABLE = str.maketrans({'\r': None, '\t': ' '})
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_AMP = re.compile(r'&(?!(amp;|lt;|gt;|apos;|quot;|#\d+;|#x[0-9a-fA-F]+;))')
+
+# 복구 경로의 정리 패턴(서브/수퍼 스크립트, <br/>, 未이스케이프 &)을 하나의
+# 교대(alternation) 정규식으로 묶어 문자열을 한 번만 순회하도록 함
+_RE_MARKUP_CLEAN = re.compile(
+    r'<sub>(.*?)</sub>|<sup>(.*?)</sup>|<br\s*/?>'
+    r'|&(?!(?:amp|lt|gt|apos|quot|#\d+|#x[0-9a-fA-F]+);)'
+)
+
+def _markup_clean_repl(m):
+    """_RE_MARKUP_CLEAN 매치 그룹에 따른 치환 값 반환"""
+    sub_text = m.group(1)
+    if sub_text is not None:
+        return sub_text
+    sup_text = m.group(2)
+    if sup_text is not None:
+        return sup_text
+    if m.group(0).startswith('<'):  # <br/>
+        return ' '
+    return '&amp;'  # 未이스케이프 &
+_RE_CDATA = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+_RE_PARAGRAPH = re.compile(r'<PARAGRAPH[^>]*>(.*?)</PARAGRAPH>', re.DOTALL)
+_RE_ARTICLE_TITLE = re.compile(r'<ARTICLE title="([^"]+)"')
+_RE_TITLE_ATTR = re.compile(r'title="([^"]+)"')
+_RE_UNCLOSED_TAG = re.compile(r'<(\w+)(?:\s+[^>]*)?>[^<]*$')
+_RE_SENTENCE_END = re.compile(r'[.!?]\s+')
+
+def _clean_paragraph_text(text):
+    """PARAGRAPH에서 추출한 텍스트의 공통 정리 (CDATA 마커/태그/엔티티/공백)"""
+    # CDATA 처리 (마커가 남아있는 경우 제거)
+    if '![CDATA[' in text:
+        text = _RE_CDATA.sub(r'\1', text)
+
+    # CDATA 안에 문자열로 살아남은 HTML 태그만 정규식으로 제거
+    if '<' in text:
+        text = _RE_TAG.sub('', text)
+
+    # HTML 엔티티 디코딩 (예: &nbsp; -> 공백)
+    text = html.unescape(text)
+
+    # 이스케이프 문자 정리 + 연속 공백 치환 + 앞뒤 공백 제거
+    return _RE_SPACES.sub(' ', text.translate(_CLEAN_TABLE)).strip()
+
+def build_doc_structure(root):
+    """
+    파싱된 XML 루트 엘리먼트를 SECTION/ARTICLE/PARAGRAPH 구조의
+    딕셔너리로 변환하는 공통 헬퍼 함수입니다.
+    """
+    # 문서 제목과 타입 추출
+    doc_title = root.get('title', '')
+    doc_type = root.get('type', '')
+
+    # 결과 구조 초기화
+    result = {
+        'title': doc_title,
+        'type': doc_type,
+        'sections': []
+    }
+
+    # 각 섹션 처리
+    for section in root.findall('SECTION'):
+        section_data = {
+            'title': section.get('title', ''),
+            'articles': []
+        }
+
+        # 섹션 내 각 아티클 처리
+        for article in section.findall('ARTICLE'):
+            article_data = {
+                'title': article.get('title', ''),
+                'paragraphs': []
+            }
+
+            # 아티클 내 각 문단 처리
+            for paragraph in article.findall('PARAGRAPH'):
+                # 하위 엘리먼트(<sub>, <sup> 등)의 텍스트까지 C 수준에서 연결
+                text = _clean_paragraph_text(''.join(paragraph.itertext()))
+
+                # 비어있지 않은 문단만 추가
+                if text:
+                    article_data['paragraphs'].append(text)
+
+            # 내용이 있는 아티클만 추가
+            if article_data['paragraphs'] or article_data['title']:
+                section_data['articles'].append(article_data)
+
+        # 내용이 있는 섹션만 추가
+        if section_data['articles']:
+            result['sections'].append(section_data)
+
+    # 텍스트 형식으로 변환
+    result['text'] = extract_text_from_parsed_doc(result)
+
+    return result
+
+def build_doc_structure_streaming(xml_string):
+    """
+    ET.iterparse로 문서를 스트리밍 파싱해 build_doc_structure와 동일한
+    구조를 만듭니다. 트리 전체를 메모리에 만들지 않고 엘리먼트를 처리
+    즉시 clear()하므로, 수 MB짜리 문서도 상주 메모리가 현재 엘리먼트
+    수준으로 유지되고 파싱과 순회가 한 번의 패스로 끝납니다.
+    """
+    result = {'title': '', 'type': '', 'sections': []}
+    section_data = None
+    article_data = None
+
+    first = True
+    for event, el in ET.iterparse(io.BytesIO(xml_string.encode('utf-8')), events=('start', 'end')):
+        if event == 'start':
+            if first:
+                # 루트(DOC) 속성
+                result['title'] = el.get('title', '')
+                result['type'] = el.get('type', '')
+                first = False
+            elif el.tag == 'SECTION':
+                section_data = {'title': el.get('title', ''), 'articles': []}
+            elif el.tag == 'ARTICLE':
+                article_data = {'title': el.get('title', ''), 'paragraphs': []}
+            continue
 
+        # end 이벤트: 구조를 닫고 처리한 엘리먼트는 즉시 해제
+        if el.tag == 'PARAGRAPH':
+            if article_data is not None:
+                text = _clean_paragraph_text(''.join(el.itertext()))
+                if text:
+                    article_data['paragraphs'].append(text)
+            el.clear()
+        elif el.tag == 'ARTICLE':
+            if section_data is not None and article_data is not None and (
+                article_data['paragraphs'] or article_data['title']
+            ):
+                section_data['articles'].append(article_data)
+            article_data = None
+            el.clear()
+        elif el.tag == 'SECTION':
+            if section_data is not None and section_data['articles']:
+                result['sections'].append(section_data)
+            section_data = None
+            el.clear()
+
+    # 텍스트 형식으로 변환
+    result['text'] = extract_text_from_parsed_doc(result)
+
+    return result
+
+@functools.lru_cache(maxsize=4096)
 def parse_xml_doc(xml_string):
     """
     CDATA 내의 XML 문서를 파싱하여 구조화된 형태로 변환합니다.
+
+    동일 성분 의약품들은 동일한 보일러플레이트 문서를 공유하는 경우가 많아
+    같은 XML 원문의 파싱 결과를 프로세스 내에서 캐싱해 재사용합니다.
+    (반환된 딕셔너리는 읽기 전용으로만 사용됨)
     """
     if not xml_string:
         return None
     
     try:
+        # lxml 사용 가능 시: recover 파서가 손상된 마크업을 스스로 복구하므로
+        # 정규식 전처리 없이 바로 파싱을 시도하고, 실패할 때만 복구 경로로 폴백
+        if lxml_etree is not None:
+            try:
+                lxml_root = lxml_etree.fromstring(xml_string.encode('utf-8'), parser=LXML_PARSER)
+            except lxml_etree.XMLSyntaxError:
+                lxml_root = None
+            if lxml_root is not None:
+                return build_doc_structure(lxml_root)
+
         # 1단계: XML을 파싱하기 전에 문제가 될 수 있는 부분을 정리
         
         # HTML 태그를 안전하게 처리 (CDATA 블록 내부 포함)
-        xml_string = re.sub(r'<sub>(.*?)</sub>', r'\1', xml_string)
-        xml_string = re.sub(r'<sup>(.*?)</sup>', r'\1', xml_string)
+        xml_string = _RE_SUB.sub(r'\1', xml_string)
+        xml_string = _RE_SUP.sub(r'\1', xml_string)
         
         # CDATA 내의 &amp; 처리 - 이미 &amp;로 인코딩된 것은 건너뛰고 일반 &만 변환
-        # CDATA 블록을 임시로 추출
-        cdata_blocks = re.findall(r'<!\[CDATA\[(.*?)\]\]>', xml_string, re.DOTALL)
-        
-        # 각 CDATA 블록 내에서 엔티티 처리
-        for block in cdata_blocks:
-            fixed_block = re.sub(r'&(?!(amp;|lt;|gt;|apos;|quot;|#\d+;|#x[0-9a-fA-F]+;))', '&amp;', block)
-            # 원본 블록을 수정된 블록으로 대체
-            xml_string = xml_string.replace('<![CDATA[' + block + ']]>', '<![CDATA[' + fixed_block + ']]>')
-        
-        # 2단계: XML 파싱 시도
+        # (블록별 findall + str.replace는 블록마다 문서 전체를 재탐색해 사실상
+        #  제곱 시간이므로, 콜백 치환으로 문서를 한 번만 순회하며 제자리 수정)
+        xml_string = _RE_CDATA.sub(
+            lambda m: '<![CDATA[' + _RE_AMP.sub('&amp;', m.group(1)) + ']]>',
+            xml_string
+        )
+        
+        # 2단계: XML 파싱 시도 (iterparse 스트리밍 - 파싱과 순회를 단일 패스로)
         try:
-            root = ET.fromstring(xml_string)
-            
-            # 문서 제목과 타입 추출
-            doc_title = root.get('title', '')
-            doc_type = root.get('type', '')
-            
-            # 결과 구조 초기화
-            result = {
-                'title': doc_title,
-                'type': doc_type,
-                'sections': []
-            }
-            
-            # 각 섹션 처리
-            for section in root.findall('SECTION'):
-                section_data = {
-                    'title': section.get('title', ''),
-                    'articles': []
-                }
-                
-                # 섹션 내 각 아티클 처리
-                for article in section.findall('ARTICLE'):
-                    article_data = {
-                        'title': article.get('title', ''),
-                        'paragraphs': []
-                    }
-                    
-                    # 아티클 내 각 문단 처리
-                    for paragraph in article.findall('PARAGRAPH'):
-                        # 텍스트 콘텐츠 가져오기 - text가 None이면 빈 문자열 사용
-                        text = paragraph.text or ''
-                        
-                        # CDATA 처리
-                        if '![CDATA[' in text:
-                            # CDATA 마커 제거
-                            text = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', text, flags=re.DOTALL)
-                        
-                        # HTML 태그 제거 - 남아있을 수 있는 모든 HTML 태그
-                        text = re.sub(r'<[^>]+>', '', text)
-                        
-                        # HTML 엔티티 디코딩 (예: &nbsp; -> 공백)
-                        text = html.unescape(text)
-                        
-                        # 이스케이프 문자 및 특수 문자 정리
-                        text = text.replace('\r', '').replace('\t', ' ')
-                        
-                        # 연속된 공백 하나로 치환
-                        text = re.sub(r' +', ' ', text)
-                        
-                        # 문단 앞뒤 공백 제거
-                        text = text.strip()
-                        
-                        # 비어있지 않은 문단만 추가
-                        if text:
-                            article_data['paragraphs'].append(text)
-                    
-                    # 내용이 있는 아티클만 추가
-                    if article_data['paragraphs'] or article_data['title']:
-                        section_data['articles'].append(article_data)
-                
-                # 내용이 있는 섹션만 추가
-                if section_data['articles']:
-                    result['sections'].append(section_data)
-            
-            # 텍스트 형식으로 변환
-            text_content = extract_text_from_parsed_doc(result)
-            result['text'] = text_content
-            
-            return result
-            
+            return build_doc_structure_streaming(xml_string)
+
         except ET.ParseError as xml_error:
             # 고급 복구 시도: 더 강력한 전처리 적용
             print(f"기본 XML 파싱 실패, 고급 복구 시도: {xml_error}")
@@ -146,86 +298,22 @@ def handle_complex_xml_parsing(xml_string):
     """
     try:
         # CDATA 마커 제거 (모든 CDATA 태그를 텍스트로 변환)
-        xml_string = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', xml_string, flags=re.DOTALL)
-        
-        # HTML 태그를 안전하게 처리
-        xml_string = re.sub(r'<sub>(.*?)</sub>', r'\1', xml_string)
-        xml_string = re.sub(r'<sup>(.*?)</sup>', r'\1', xml_string)
-        xml_string = re.sub(r'<br\s*/?>', ' ', xml_string)
+        xml_string = _RE_CDATA.sub(r'\1', xml_string)
         
-        # 모든 & 기호를 &amp;로 변환 (이미 인코딩된 엔티티는 제외)
-        xml_string = re.sub(r'&(?!(amp;|lt;|gt;|apos;|quot;|#\d+;|#x[0-9a-fA-F]+;))', '&amp;', xml_string)
+        # HTML 태그 정리 + 未이스케이프 & 정규화를 한 번의 패스로 처리
+        xml_string = _RE_MARKUP_CLEAN.sub(_markup_clean_repl, xml_string)
         
         # 닫히지 않은 태그 처리
         # 예: <PARAGRAPH> ... (닫는 태그 없음) -> <PARAGRAPH> ... </PARAGRAPH>
-        opened_tags = re.findall(r'<(\w+)(?:\s+[^>]*)?>[^<]*$', xml_string)
+        opened_tags = _RE_UNCLOSED_TAG.findall(xml_string)
         for tag in reversed(opened_tags):
             xml_string += f'</{tag}>'
         
         # 이제 XML 파싱 다시 시도
         try:
             root = ET.fromstring(xml_string)
-            # 이후 로직은 기존 parse_xml_doc과 동일...
-            
-            # 문서 제목과 타입 추출
-            doc_title = root.get('title', '')
-            doc_type = root.get('type', '')
-            
-            # 결과 구조 초기화
-            result = {
-                'title': doc_title,
-                'type': doc_type,
-                'sections': []
-            }
-            
-            # 각 섹션 처리
-            for section in root.findall('SECTION'):
-                section_data = {
-                    'title': section.get('title', ''),
-                    'articles': []
-                }
-                
-                # 섹션 내 각 아티클 처리
-                for article in section.findall('ARTICLE'):
-                    article_data = {
-                        'title': article.get('title', ''),
-                        'paragraphs': []
-                    }
-                    
-                    # 아티클 내 각 문단 처리
-                    for paragraph in article.findall('PARAGRAPH'):
-                        # 텍스트 콘텐츠 가져오기
-                        text = paragraph.text or ''
-                        
-                        # HTML 태그 제거
-                        text = re.sub(r'<[^>]+>', '', text)
-                        
-                        # HTML 엔티티 디코딩
-                        text = html.unescape(text)
-                        
-                        # 특수 문자 정리
-                        text = text.replace('\r', '').replace('\t', ' ')
-                        text = re.sub(r' +', ' ', text)
-                        text = text.strip()
-                        
-                        # 비어있지 않은 문단만 추가
-                        if text:
-                            article_data['paragraphs'].append(text)
-                    
-                    # 내용이 있는 아티클만 추가
-                    if article_data['paragraphs'] or article_data['title']:
-                        section_data['articles'].append(article_data)
-                
-                # 내용이 있는 섹션만 추가
-                if section_data['articles']:
-                    result['sections'].append(section_data)
-            
-            # 텍스트 형식으로 변환
-            text_content = extract_text_from_parsed_doc(result)
-            result['text'] = text_content
-            
-            return result
-            
+            return build_doc_structure(root)
+
         except ET.ParseError:
             # 최종 대안: 비정규식 텍스트 추출 시도
             return extract_text_from_broken_xml(xml_string)
@@ -237,23 +325,23 @@ def handle_complex_xml_parsing(xml_string):
 def extract_text_from_parsed_doc(doc_data):
     """파싱된 문서 구조에서 텍스트를 추출하는 헬퍼 함수"""
     result = []
-    
+    result_append = result.append  # 루프 내 속성 조회 제거
+
     # 문서 제목 추가
     if doc_data.get('title'):
-        result.append(f"【{doc_data['title']}】")
-    
+        result_append(f"【{doc_data['title']}】")
+
     # 각 섹션 처리
-    for section in doc_data.get('sections', []):
+    for section in doc_data.get('sections', ()):
         # 각 아티클 처리
-        for article in section.get('articles', []):
+        for article in section.get('articles', ()):
             # 아티클 제목 추가 (있는 경우)
             if article.get('title'):
-                result.append(f"\n■ {article['title']}")
-            
-            # 문단 추가
-            for paragraph in article.get('paragraphs', []):
-                result.append(f"- {paragraph}")
-    
+                result_append(f"\n■ {article['title']}")
+
+            # 문단 추가 (접두어 연결은 C 수준 제너레이터로)
+            result.extend('- ' + paragraph for paragraph in article.get('paragraphs', ()))
+
     return '\n'.join(result)
 
 def extract_text_from_broken_xml(xml_string):
@@ -265,25 +353,23 @@ def extract_text_from_broken_xml(xml_string):
     
     try:
         # 모든 HTML/XML 태그 처리 전 CDATA 마커 제거
-        xml_string = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', xml_string, flags=re.DOTALL)
+        xml_string = _RE_CDATA.sub(r'\1', xml_string)
         
-        # HTML 태그 처리
-        xml_string = re.sub(r'<sub>(.*?)</sub>', r'\1', xml_string)
-        xml_string = re.sub(r'<sup>(.*?)</sup>', r'\1', xml_string)
-        xml_string = re.sub(r'<br\s*/?>', ' ', xml_string)
+        # HTML 태그 정리 (서브/수퍼 스크립트, <br/>)를 한 번의 패스로 처리
+        xml_string = _RE_MARKUP_CLEAN.sub(_markup_clean_repl, xml_string)
         
         # 문서 제목 추출 시도
-        title_match = re.search(r'title="([^"]+)"', xml_string)
+        title_match = _RE_TITLE_ATTR.search(xml_string)
         doc_title = title_match.group(1) if title_match else "제목 없음"
         
         # SECTION, ARTICLE, PARAGRAPH 태그 사이의 콘텐츠 추출
         sections = []
         
         # 아티클 제목 추출
-        article_titles = re.findall(r'<ARTICLE title="([^"]+)"', xml_string)
+        article_titles = _RE_ARTICLE_TITLE.findall(xml_string)
         
         # PARAGRAPH 내용 추출
-        paragraph_contents = re.findall(r'<PARAGRAPH[^>]*>(.*?)</PARAGRAPH>', xml_string, re.DOTALL)
+        paragraph_contents = _RE_PARAGRAPH.findall(xml_string)
         
         # 구조화된 결과 생성
         result = {
@@ -304,13 +390,11 @@ def extract_text_from_broken_xml(xml_string):
         # 문단 내용 추가
         for content in paragraph_contents:
             # HTML 태그 제거
-            content = re.sub(r'<[^>]+>', '', content)
+            content = _RE_TAG.sub('', content)
             # HTML 엔티티 디코딩
             content = html.unescape(content)
-            # 특수 문자 정리
-            content = content.replace('\r', '').replace('\t', ' ')
-            content = re.sub(r' +', ' ', content)
-            content = content.strip()
+            # 특수 문자 정리 + 연속 공백 치환 + 앞뒤 공백 제거
+            content = _RE_SPACES.sub(' ', content.translate(_CLEAN_TABLE)).strip()
             
             if content:
                 text_parts.append(f"- {content}")
@@ -321,12 +405,12 @@ def extract_text_from_broken_xml(xml_string):
         # 텍스트가 없으면 다른 방법으로 추출 시도
         if result['text'] == f"【{doc_title}】":
             # 모든 XML 태그 제거
-            plain_text = re.sub(r'<[^>]*>', ' ', xml_string)
+            plain_text = _RE_ANY_TAG.sub(' ', xml_string)
             plain_text = html.unescape(plain_text)
-            plain_text = re.sub(r'\s+', ' ', plain_text).strip()
+            plain_text = _RE_WHITESPACE.sub(' ', plain_text).strip()
             
             # 의미 있는 문장 추출
-            sentences = re.split(r'[.!?]\s+', plain_text)
+            sentences = _RE_SENTENCE_END.split(plain_text)
             meaningful_sentences = [s.strip() + '.' for s in sentences if len(s.strip()) > 10]
             
             if meaningful_sentences:
@@ -341,9 +425,9 @@ def extract_text_from_broken_xml(xml_string):
         
         # 최후의 방법: 모든 XML 태그를 제거하고 단순 텍스트만 추출
         try:
-            text = re.sub(r'<[^>]*>', ' ', original_xml)
+            text = _RE_ANY_TAG.sub(' ', original_xml)
             text = html.unescape(text)
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = _RE_WHITESPACE.sub(' ', text).strip()
             
             return {
                 'title': '텍스트 추출',
@@ -357,265 +441,469 @@ def extract_text_from_broken_xml(xml_string):
                 'text': '텍스트 추출에 실패했습니다.'
             }
 
-def fetch_drug_approval_data():
+def open_parse_cache(cache_file=PARSE_CACHE_FILE):
+    """
+    파싱 결과 영속 캐시(sqlite)를 엽니다. XML 원문 해시를 키로 파싱 결과를
+    보관하므로, 다음 실행에서 내용이 바뀌지 않은 문서는 파싱을 건너뜁니다.
+    열기에 실패하면 None을 반환하고 캐시 없이 동작합니다.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        conn = sqlite3.connect(cache_file)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS parsed_docs (xml_hash TEXT PRIMARY KEY, parsed TEXT NOT NULL)"
+        )
+        return conn
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ 파싱 캐시를 열 수 없어 캐시 없이 진행합니다: {e}")
+        return None
+
+def _xml_hash(xml_string):
+    """XML 원문의 blake2b 해시 (캐시 키)"""
+    return hashlib.blake2b(xml_string.encode("utf-8"), digest_size=16).hexdigest()
+
+def parse_doc_fields(xml_jobs, executor=None, cache=None):
+    """
+    (item, field) 작업 목록의 XML 문서를 일괄 파싱해 각 item의
+    '<field>_PARSED' 키에 결과를 채워 넣습니다.
+
+    cache(sqlite 연결)가 주어지면 XML 해시가 일치하는 문서는 이전 실행의
+    파싱 결과를 재사용합니다. 캐시 미스만 실제로 파싱하며, XML 파싱은
+    순수 CPU 작업이므로 프로세스 풀이 주어지면 GIL을 우회해 코어 수만큼
+    병렬로 수행하고, 풀이 없으면 직렬로 처리합니다.
+    """
+    if not xml_jobs:
+        return
+
+    # 1. 캐시 조회 - 적중한 작업은 파싱 대상에서 제외
+    miss_jobs = xml_jobs
+    if cache is not None:
+        miss_jobs = []
+        hashes = [_xml_hash(item[field]) for item, field in xml_jobs]
+        try:
+            placeholders = ",".join("?" * len(hashes))
+            rows = cache.execute(
+                f"SELECT xml_hash, parsed FROM parsed_docs WHERE xml_hash IN ({placeholders})",
+                hashes,
+            ).fetchall()
+            cached = {h: json.loads(parsed) for h, parsed in rows}
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            print(f"⚠️ 파싱 캐시 조회 실패, 전체 파싱으로 진행: {e}")
+            cached = {}
+
+        miss_hashes = []
+        for (item, field), h in zip(xml_jobs, hashes):
+            if h in cached:
+                item[f"{field}_PARSED"] = cached[h]
+            else:
+                miss_jobs.append((item, field))
+                miss_hashes.append(h)
+
+        if not miss_jobs:
+            return
+
+    xml_strings = [item[field] for item, field in miss_jobs]
+
+    parsed_docs = None
+    if executor is not None:
+        try:
+            parsed_docs = list(executor.map(parse_xml_doc, xml_strings, chunksize=16))
+        except Exception as e:
+            print(f"❌ 병렬 XML 파싱 실패, 직렬 처리로 전환: {e}")
+            parsed_docs = None
+
+    if parsed_docs is None:
+        parsed_docs = []
+        for xml_string in xml_strings:
+            try:
+                parsed_docs.append(parse_xml_doc(xml_string))
+            except Exception as e:
+                print(f"❌ XML 파싱 중 예외 발생: {e}")
+                # 백업 처리: 텍스트 추출 시도
+                parsed_docs.append(extract_text_from_broken_xml(xml_string))
+
+    for (item, field), parsed_doc in zip(miss_jobs, parsed_docs):
+        item[f"{field}_PARSED"] = parsed_doc
+
+        # 파싱 실패 시 로그 출력
+        if parsed_doc and parsed_doc.get('type') == 'error':
+            print(f"⚠️ {field} 필드 파싱 실패: {parsed_doc.get('error')}")
+
+    # 2. 캐시 미스 결과를 기록 (오류 결과는 다음 실행에서 재시도하도록 제외)
+    if cache is not None:
+        try:
+            cache.executemany(
+                "INSERT OR REPLACE INTO parsed_docs (xml_hash, parsed) VALUES (?, ?)",
+                [
+                    (h, json.dumps(parsed_doc, ensure_ascii=False))
+                    for h, parsed_doc in zip(miss_hashes, parsed_docs)
+                    if parsed_doc and parsed_doc.get('type') != 'error'
+                ],
+            )
+            cache.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️ 파싱 캐시 기록 실패: {e}")
+
+def write_json_file(path, obj):
+    """
+    JSON 파일을 저장합니다. orjson이 있으면 바이트 직렬화(2칸 들여쓰기)를
+    사용하고, 없으면 stdlib json으로 동일한 형식을 유지합니다.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+
+class RawStreamWriter:
+    """
+    원본 데이터를 수집 도중 페이지 단위로 JSONL(줄 단위 JSON)로 기록합니다.
+    원본은 기계가 소비하는 중간 산출물이므로 들여쓰기 없이 한 항목당 한 줄로
+    저장합니다 (파일 크기 절반 수준, 괄호/쉼표 상태 관리도 불필요).
+    수집이 중단되더라도 그때까지의 원본이 온전한 줄 단위로 파일에 남습니다.
+    """
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._f = open(path, "wb")
+
+    def write_items(self, items):
+        """항목 리스트를 한 줄에 하나씩 이어서 기록합니다."""
+        for item in items:
+            if orjson is not None:
+                self._f.write(orjson.dumps(item))
+            else:
+                self._f.write(json.dumps(item, ensure_ascii=False).encode("utf-8"))
+            self._f.write(b"\n")
+
+    def close(self):
+        self._f.close()
+
+def extract_items_from_response(data, page_no):
+    """
+    API 응답 JSON에서 items 리스트와 totalCount를 추출합니다.
+    두 가지 응답 구조("body" 직하 / "response" 아래 "body")를 지원합니다.
+
+    Returns:
+        (items 리스트 또는 None, total_count)
+    """
+    if "header" in data and "body" in data:
+        body = data["body"]
+    elif "response" in data and "body" in data["response"]:
+        body = data["response"]["body"]
+    else:
+        print(f"❌ 예상치 못한 API 응답 구조: {list(data.keys())}")
+        return None, 0
+
+    items = body.get("items")
+    if not items:
+        print(f"📢 페이지 {page_no}에서 항목이 없습니다.")
+        return None, body.get("totalCount", 0)
+
+    # items가 단일 객체인 경우 리스트로 변환
+    if isinstance(items, dict):
+        items = [items]
+
+    return items, body.get("totalCount", 0)
+
+def fetch_page_sync(page_no, page_size, max_retries=3):
+    """
+    한 페이지를 동기 방식으로 요청해 파싱된 JSON을 반환합니다.
+    (세션 어댑터의 자동 재시도 외에 JSON 파싱 오류 등도 재시도)
+
+    Returns:
+        응답 JSON 딕셔너리, 실패 시 None
+    """
+    params = {
+        "serviceKey": API_KEY,
+        "pageNo": page_no,
+        "numOfRows": page_size,
+        "type": "json"
+    }
+
+    for attempt in range(max_retries):
+        try:
+            response = session.get(BASE_URL, params=params, timeout=30)
+            logger.debug("페이지 %s 응답 코드: %s", page_no, response.status_code)
+
+            if response.status_code != 200:
+                print(f"❌ API 요청 실패! 상태 코드: {response.status_code}")
+                print(f"⚠️ 응답 텍스트: {response.text[:500]}")
+            else:
+                try:
+                    return response.json()
+                except json.JSONDecodeError:
+                    print(f"❌ JSON 파싱 오류! 응답이 올바른 JSON 형식이 아닙니다.")
+                    print(f"응답 내용: {response.text[:500]}...")
+        except requests.exceptions.RequestException as e:
+            print(f"❌ 데이터 가져오기 오류: {e}")
+
+        if attempt < max_retries - 1:
+            print(f"재시도 중... ({attempt + 1}/{max_retries})")
+            time.sleep(2)
+
+    return None
+
+async def fetch_pages_async(page_numbers, page_size, concurrency=8, max_retries=3):
+    """
+    여러 페이지를 aiohttp로 동시에 요청합니다.
+    세마포어로 동시 요청 수를 제한해 API 쿼터를 존중합니다.
+
+    Returns:
+        {page_no: 응답 JSON 또는 None} 딕셔너리
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=concurrency),
+        timeout=timeout
+    ) as async_session:
+
+        async def fetch_page(page_no):
+            params = {
+                "serviceKey": API_KEY,
+                "pageNo": str(page_no),
+                "numOfRows": str(page_size),
+                "type": "json"
+            }
+            async with semaphore:
+                for attempt in range(max_retries):
+                    try:
+                        async with async_session.get(BASE_URL, params=params) as response:
+                            if response.status != 200:
+                                print(f"❌ 페이지 {page_no} 요청 실패! 상태 코드: {response.status}")
+                            else:
+                                # content_type=None: 일부 응답이 text/html로 내려와도 JSON 파싱 허용
+                                return page_no, await response.json(content_type=None)
+                    except Exception as e:
+                        print(f"❌ 페이지 {page_no} 가져오기 오류: {e}")
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(2)
+                return page_no, None
+
+        results = await asyncio.gather(*[fetch_page(n) for n in page_numbers])
+
+    return dict(results)
+
+def process_page_items(items, seen_item_sequences, xml_executor, parse_cache=None):
+    """
+    한 페이지의 항목들을 필터링(중복/허가 취소/수출용)하고 필요한 필드만
+    남긴 뒤, XML 문서 필드를 일괄 파싱합니다.
+
+    Returns:
+        (processed_items, new_item_count, canceled_count, export_count)
+    """
+    processed_items = []
+    new_item_count = 0
+    canceled_count = 0
+    export_count = 0
+    xml_jobs = []  # 병렬 파싱할 (item, field) 목록
+
+    for item in items:
+        item_seq = item.get("ITEM_SEQ", "")
+
+        # 이미 처리한 아이템 건너뛰기
+        if item_seq in seen_item_sequences:
+            continue
+
+        # 허가 취소된 의약품 필터링 (항목 단위 출력은 debug 로그로만)
+        if item.get("CANCEL_DATE"):
+            logger.debug("허가 취소된 의약품 제외: %s (취소일: %s)", item.get('ITEM_NAME', '이름 없음'), item['CANCEL_DATE'])
+            canceled_count += 1
+            continue
+
+        # 수출용 의약품 필터링
+        item_name = item.get("ITEM_NAME", "")
+        if "(수출용)" in item_name:
+            logger.debug("수출용 의약품 제외: %s", item_name)
+            export_count += 1
+            continue
+
+        seen_item_sequences.add(item_seq)
+        new_item_count += 1
+
+        # 필요한 필드만 추출 (딕셔너리 컴프리헨션 - 단일 BUILD_MAP 루프)
+        filtered_item = {key: item.get(key, "") for key in REQUIRED_FIELDS}
+
+        # ETC_OTC_CODE 처리
+        if filtered_item.get("ETC_OTC_CODE") and not filtered_item.get("ETC_OTC_NAME"):
+            filtered_item["ETC_OTC_NAME"] = filtered_item["ETC_OTC_CODE"]
+
+        # XML 문서 필드는 여기서 파싱하지 않고 수집만 해 두었다가
+        # 페이지 단위로 묶어 프로세스 풀에서 병렬 파싱
+        for field in DOC_FIELDS:
+            if filtered_item.get(field):
+                xml_jobs.append((filtered_item, field))
+
+        processed_items.append(filtered_item)
+
+    # 이 페이지의 XML 문서들을 일괄 파싱 (캐시 적중분은 재사용)
+    parse_doc_fields(xml_jobs, xml_executor, parse_cache)
+
+    return processed_items, new_item_count, canceled_count, export_count
+
+def fetch_drug_approval_data(raw_file=None):
     """
     의약품 허가 정보 데이터를 API에서 가져오고 XML 문서를 파싱합니다.
+    첫 페이지 응답으로 totalCount를 파악한 뒤, 나머지 페이지는 aiohttp로
+    동시에 수집합니다 (aiohttp 미설치 또는 totalCount 미제공 시 순차 수집).
     허가 취소된 의약품과 수출용 의약품을 건너뜁니다.
+
+    raw_file이 주어지면 페이지를 처리할 때마다 원본 항목을 곧바로 파일에
+    기록합니다 (전체 수집 완료 후 한 번에 직렬화하지 않음).
     """
-    page_no = 1
     page_size = 100
     total_data = []
-    max_retries = 3  # API 요청 실패 시 최대 재시도 횟수
-    last_page_items = -1  # 이전 페이지의 항목 수 (초기값은 -1로 설정)
     seen_item_sequences = set()  # 이미 수집한 아이템 일련번호 추적
-    
+
     # 필터링 카운터 초기화
     filtered_canceled_count = 0
     filtered_export_count = 0
 
-    while True:
-        params = {
-            "serviceKey": API_KEY,
-            "pageNo": page_no,
-            "numOfRows": page_size,
-            "type": "json"
-        }
+    # XML 파싱(순수 CPU)을 페이지 단위로 병렬화하기 위한 프로세스 풀
+    # (페이지마다 생성하지 않고 수집 전체 기간 동안 재사용)
+    try:
+        xml_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    except OSError as e:
+        print(f"⚠️ 프로세스 풀 생성 실패, XML 직렬 파싱 사용: {e}")
+        xml_executor = None
 
-        # 요청 URL 생성
-        request_url = f"{BASE_URL}?{urlencode(params)}"
-        print(f"🔗 요청 URL: {request_url}")
+    raw_writer = RawStreamWriter(raw_file) if raw_file else None
 
-        retries = 0
-        success = False
-        
-        while retries < max_retries and not success:
-            try:
-                response = requests.get(request_url, timeout=30)
-                print(f"🔍 API 응답 코드: {response.status_code}")
-                
-                if response.status_code != 200:
-                    print(f"❌ API 요청 실패! 상태 코드: {response.status_code}")
-                    print(f"⚠️ 응답 텍스트: {response.text}")
-                    retries += 1
-                    if retries < max_retries:
-                        print(f"재시도 중... ({retries}/{max_retries})")
-                        time.sleep(2)
-                        continue
-                    break
-                
-                # 응답 확인을 위한 미리보기
-                response_preview = response.text[:200] + "..." if len(response.text) > 200 else response.text
-                print(f"🔍 응답 미리보기: {response_preview}")
+    # 이전 실행의 파싱 결과 재사용을 위한 영속 캐시
+    parse_cache = open_parse_cache()
 
-                # 응답 데이터 파싱
-                try:
-                    data = response.json()
-                except json.JSONDecodeError:
-                    print(f"❌ JSON 파싱 오류! 응답이 올바른 JSON 형식이 아닙니다.")
-                    print(f"응답 내용: {response.text[:500]}...")
-                    retries += 1
-                    if retries < max_retries:
-                        time.sleep(2)
-                        continue
+    try:
+        # 1. 첫 페이지를 동기 요청해 totalCount 파악
+        first_response = fetch_page_sync(1, page_size)
+        if first_response is None:
+            print("⚠️ 첫 페이지 요청 실패. 데이터 수집을 중단합니다.")
+            return total_data
+
+        items, total_count = extract_items_from_response(first_response, 1)
+        if items is None:
+            print("❌ 데이터를 가져오지 못했습니다.")
+            return total_data
+
+        processed_items, _, canceled, export = process_page_items(items, seen_item_sequences, xml_executor, parse_cache)
+        filtered_canceled_count += canceled
+        filtered_export_count += export
+        total_data.extend(processed_items)
+        if raw_writer:
+            raw_writer.write_items(processed_items)
+        print(f"✅ 페이지 1: {len(processed_items)}개 수집 (제외: 허가 취소 {canceled}개, 수출용 {export}개)")
+
+        estimated_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 0
+        if estimated_pages > 1:
+            print(f"📊 총 {total_count}개 항목, {estimated_pages}개 페이지 수집 예정")
+
+        # 2. 나머지 페이지 수집
+        if aiohttp is not None and estimated_pages > 1:
+            # totalCount를 알면 나머지 페이지를 동시에 요청 (벽시계 시간이
+            # 페이지별 지연의 합에서 최대값 수준으로 줄어듦)
+            page_responses = asyncio.run(
+                fetch_pages_async(range(2, estimated_pages + 1), page_size)
+            )
+
+            for page_no in sorted(page_responses):
+                data = page_responses[page_no]
+                if data is None:
+                    print(f"⚠️ 페이지 {page_no} 수집 실패. 건너뜁니다.")
+                    continue
+
+                items, _ = extract_items_from_response(data, page_no)
+                if not items:
+                    continue
+
+                processed_items, _, canceled, export = process_page_items(items, seen_item_sequences, xml_executor, parse_cache)
+                filtered_canceled_count += canceled
+                filtered_export_count += export
+                total_data.extend(processed_items)
+                if raw_writer:
+                    raw_writer.write_items(processed_items)
+                print(f"✅ 페이지 {page_no}/{estimated_pages}: {len(processed_items)}개 수집 (제외: 허가 취소 {canceled}개, 수출용 {export}개)")
+
+        else:
+            # totalCount를 모르거나 aiohttp가 없으면 순차 수집으로 폴백
+            page_no = 2
+            while True:
+                data = fetch_page_sync(page_no, page_size)
+                if data is None:
+                    print(f"⚠️ 페이지 {page_no} 처리 실패. 데이터 수집을 중단합니다.")
                     break
-                
-                # 응답 구조 확인
-                print(f"🔍 응답 구조 키: {list(data.keys())}")
-                
-                # 데이터 추출 로직
-                items = None
-                total_count = 0
-                
-                # 응답 구조 확인
-                if "header" in data and "body" in data:
-                    if "items" not in data["body"] or not data["body"]["items"]:
-                        print(f"📢 페이지 {page_no}에서 항목이 없습니다. 데이터 수집을 종료합니다.")
-                        break
-                    
-                    items = data["body"]["items"]
-                    total_count = data["body"].get("totalCount", 0)
-                    
-                elif "response" in data and "body" in data["response"]:
-                    if "items" not in data["response"]["body"] or not data["response"]["body"]["items"]:
-                        print(f"📢 페이지 {page_no}에서 항목이 없습니다. 데이터 수집을 종료합니다.")
-                        break
-                    
-                    items = data["response"]["body"]["items"]
-                    total_count = data["response"]["body"].get("totalCount", 0)
-                    
-                else:
-                    print(f"❌ 예상치 못한 API 응답 구조: {list(data.keys())}")
-                    retries += 1
-                    if retries < max_retries:
-                        time.sleep(2)
-                        continue
+
+                items, total_count = extract_items_from_response(data, page_no)
+                if not items:
+                    print(f"📢 페이지 {page_no}에서 데이터 수집을 종료합니다.")
                     break
-                
-                # items가 단일 객체인 경우 리스트로 변환
-                if isinstance(items, dict):
-                    items = [items]
-                
-                # 중복 확인 로직
-                if len(items) == last_page_items and last_page_items > 0:
-                    # 항목 개수가 이전과 같은 경우, 내용도 중복인지 확인
-                    current_item_sequences = [item.get("ITEM_SEQ", "") for item in items]
-                    current_sequences_set = set(current_item_sequences)
-                    
-                    # 이미 처리한 아이템인지 확인
-                    if current_sequences_set.issubset(seen_item_sequences):
-                        print(f"🛑 페이지 {page_no}의 모든 항목이 이미 처리되었습니다. 데이터 수집을 종료합니다.")
-                        break
-                
-                # 필요한 필드만 필터링하고 XML 파싱
-                processed_items = []
-                new_item_count = 0
-                
-                for item in items:
-                    item_seq = item.get("ITEM_SEQ", "")
-                    
-                    # 이미 처리한 아이템 건너뛰기
-                    if item_seq in seen_item_sequences:
-                        continue
-                    
-                    # 허가 취소된 의약품 필터링
-                    if item.get("CANCEL_DATE"):
-                        print(f"📢 허가 취소된 의약품 제외: {item.get('ITEM_NAME', '이름 없음')} (취소일: {item['CANCEL_DATE']})")
-                        filtered_canceled_count += 1
-                        continue
-                    
-                    # 수출용 의약품 필터링
-                    item_name = item.get("ITEM_NAME", "")
-                    if "(수출용)" in item_name:
-                        print(f"📢 수출용 의약품 제외: {item_name}")
-                        filtered_export_count += 1
-                        continue
-                    
-                    seen_item_sequences.add(item_seq)
-                    new_item_count += 1
-                    
-                    # 필요한 필드만 추출
-                    filtered_item = {}
-                    for key in REQUIRED_FIELDS:
-                        filtered_item[key] = item.get(key, "")
-                    
-                    # ETC_OTC_CODE 처리
-                    if filtered_item.get("ETC_OTC_CODE") and not filtered_item.get("ETC_OTC_NAME"):
-                        filtered_item["ETC_OTC_NAME"] = filtered_item["ETC_OTC_CODE"]
-                    
-                    # XML 문서 파싱 (개선된 파싱 로직 사용)
-                    for field in ['EE_DOC_DATA', 'UD_DOC_DATA', 'NB_DOC_DATA']:
-                        if filtered_item.get(field):
-                            try:
-                                # XML 파싱 시도
-                                parsed_doc = parse_xml_doc(filtered_item[field])
-                                filtered_item[f"{field}_PARSED"] = parsed_doc
-                                
-                                # 파싱 실패 시 로그 출력
-                                if parsed_doc and parsed_doc.get('type') == 'error':
-                                    print(f"⚠️ {field} 필드 파싱 실패: {parsed_doc.get('error')}")
-                            except Exception as e:
-                                print(f"❌ {field} 파싱 중 예외 발생: {e}")
-                                # 백업 처리: 텍스트 추출 시도
-                                filtered_item[f"{field}_PARSED"] = extract_text_from_broken_xml(filtered_item[field])
-                    
-                    processed_items.append(filtered_item)
-
-                # 새로운 아이템이 없으면 종료
+
+                processed_items, new_item_count, canceled, export = process_page_items(items, seen_item_sequences, xml_executor, parse_cache)
+                filtered_canceled_count += canceled
+                filtered_export_count += export
+
+                # 새로운 아이템이 없으면 종료 (API가 같은 페이지를 반복 반환하는 경우)
                 if new_item_count == 0:
                     print(f"📢 페이지 {page_no}에서 새로운 항목이 없습니다. 데이터 수집을 종료합니다.")
                     break
-                
-                # 데이터 추가
+
                 total_data.extend(processed_items)
-                print(f"✅ 페이지 {page_no}에서 {len(processed_items)}개 레코드를 가져와 처리했습니다.")
-                print(f"📊 현재까지 필터링된 의약품: 허가 취소 {filtered_canceled_count}개, 수출용 {filtered_export_count}개")
-                
+                if raw_writer:
+                    raw_writer.write_items(processed_items)
+                print(f"✅ 페이지 {page_no}: {len(processed_items)}개 수집 (제외: 허가 취소 {canceled}개, 수출용 {export}개)")
+
                 # 마지막 페이지 도달 확인
                 if total_count > 0:
                     estimated_pages = (total_count + page_size - 1) // page_size  # 올림 나눗셈
                     print(f"📊 현재 진행 상황: 페이지 {page_no}/{estimated_pages}, 총 데이터: {len(total_data)}/{total_count}")
-                    
+
                     if page_no >= estimated_pages:
                         print(f"📢 마지막 페이지에 도달했습니다. 데이터 수집을 종료합니다.")
                         break
-                
+
                 # 페이지 크기보다 적은 데이터가 반환되면 마지막 페이지로 간주
                 if len(items) < page_size:
                     print(f"📢 페이지 크기보다 적은 항목을 받았습니다. 마지막 페이지로 추정됩니다.")
                     break
-                
-                # 성공 표시
-                success = True
-                last_page_items = len(items)
-                
-            except requests.exceptions.RequestException as e:
-                print(f"❌ 데이터 가져오기 오류: {e}")
-                retries += 1
-                if retries < max_retries:
-                    print(f"재시도 중... ({retries}/{max_retries})")
-                    time.sleep(2)
-                else:
-                    break
-            except Exception as e:
-                print(f"❌ 예상치 못한 오류: {e}")
-                retries += 1
-                if retries < max_retries:
-                    print(f"재시도 중... ({retries}/{max_retries})")
-                    time.sleep(2)
-                else:
-                    print("최대 재시도 횟수 초과. 진행을 중단합니다.")
-                    return total_data
-        
-        # 성공하지 못했으면 종료
-        if not success:
-            print(f"⚠️ 페이지 {page_no} 처리 실패. 데이터 수집을 중단합니다.")
-            break
-        
-        # 다음 페이지로 이동
-        page_no += 1
-    
+
+                page_no += 1
+
+    finally:
+        if raw_writer:
+            raw_writer.close()
+        if xml_executor is not None:
+            xml_executor.shutdown()
+        if parse_cache is not None:
+            parse_cache.close()
+
     print(f"✅ 데이터 수집 완료. 총 {len(total_data)}개 항목 수집, 필터링된 항목: 허가 취소 {filtered_canceled_count}개, 수출용 {filtered_export_count}개")
     return total_data
 
 def process_and_save_data(data, raw_file, processed_file):
     """
     데이터를 처리하고 저장합니다.
-    이미 fetch_drug_approval_data에서 필터링을 했지만, 안전을 위해 한번 더 필터링합니다.
+    필터링(허가 취소/수출용/중복)은 fetch_drug_approval_data에서 이미
+    보장되므로 여기서는 반복하지 않습니다.
+    원본 데이터는 수집 단계에서 스트리밍으로 저장되므로 raw_file이 주어진
+    경우에만 (수집 단계에서 저장하지 못한 경우) 여기서 저장합니다.
     """
     # 디렉토리 생성
-    os.makedirs(os.path.dirname(raw_file), exist_ok=True)
     os.makedirs(os.path.dirname(processed_file), exist_ok=True)
+
+    # 원본 데이터 저장 (수집 단계에서 저장하지 않은 경우)
+    if raw_file:
+        print(f"📁 원본 데이터를 {raw_file}에 저장합니다...")
+        writer = RawStreamWriter(raw_file)
+        writer.write_items(data)
+        writer.close()
     
-    # 원본 데이터 저장
-    print(f"📁 원본 데이터를 {raw_file}에 저장합니다...")
-    with open(raw_file, "w", encoding="utf-8") as raw_json_file:
-        json.dump(data, raw_json_file, ensure_ascii=False, indent=2)
-    
-    # 한번 더 필터링 적용 (안전 확인)
-    filtered_data = []
-    filtered_canceled_count = 0
-    filtered_export_count = 0
-    
-    for item in data:
-        # 허가 취소된 의약품 필터링
-        if item.get("CANCEL_DATE"):
-            filtered_canceled_count += 1
-            continue
-        
-        # 수출용 의약품 필터링
-        item_name = item.get("ITEM_NAME", "")
-        if "(수출용)" in item_name:
-            filtered_export_count += 1
-            continue
-        
-        filtered_data.append(item)
-    
-    if filtered_canceled_count > 0 or filtered_export_count > 0:
-        print(f"⚠️ 추가 필터링: 허가 취소 의약품 {filtered_canceled_count}개, 수출용 의약품 {filtered_export_count}개가 제외되었습니다.")
-    
-    # 텍스트 형식으로 추출한 데이터 생성
+    # 텍스트 추출과 오류 수집을 한 번의 순회로 처리
+    # (수집 단계에서 이미 필터링된 데이터이므로 재필터링 없이 바로 변환)
     text_data = []
-    for item in filtered_data:
+    error_records = []
+    no_content_count = 0
+    for item in data:
         # 기본 필드 추출
         text_item = {
             'ITEM_SEQ': item.get('ITEM_SEQ', ''),
@@ -651,25 +939,39 @@ def process_and_save_data(data, raw_file, processed_file):
                 else:
                     text_item[target_field] = ''
         
-        # 데이터 품질 확인
-        has_content = False
-        for field in ['EFFECTIVENESS', 'USAGE_DOSAGE', 'PRECAUTIONS']:
-            if text_item.get(field) and len(text_item[field]) > 10:  # 의미 있는 내용이 있는지 확인
-                has_content = True
-                break
+        # 데이터 품질 확인 (10자 초과 내용이 하나라도 있는지)
+        has_content = any(len(text_item.get(f, '')) > 10 for f in _CONTENT_FIELDS)
         
         # 의미 있는 내용이 있는 항목만 추가
         if has_content or (text_item.get('ITEM_NAME') and text_item.get('ENTP_NAME')):
             text_data.append(text_item)
         else:
-            print(f"⚠️ 항목 '{text_item.get('ITEM_NAME', '이름 없음')}' (ID: {text_item.get('ITEM_SEQ', '일련번호 없음')})에 의미 있는 내용이 없어 제외합니다.")
+            logger.debug("항목 '%s' (ID: %s)에 의미 있는 내용이 없어 제외", text_item.get('ITEM_NAME', '이름 없음'), text_item.get('ITEM_SEQ', '일련번호 없음'))
+            no_content_count += 1
+
+        # XML 파싱 오류 수집 (에러 보고서용)
+        error_fields = []
+        for field in ['EE_DOC_DATA_PARSED', 'UD_DOC_DATA_PARSED', 'NB_DOC_DATA_PARSED']:
+            if field in item and item[field] and item[field].get('type') == 'error':
+                error_fields.append({
+                    'field': field.replace('_PARSED', ''),
+                    'error': item[field].get('error', '알 수 없는 오류')
+                })
+
+        if error_fields:
+            error_records.append({
+                'ITEM_SEQ': item.get('ITEM_SEQ', ''),
+                'ITEM_NAME': item.get('ITEM_NAME', ''),
+                'error_fields': error_fields
+            })
     
     # 처리된 데이터 저장
     print(f"📁 처리된 데이터를 {processed_file}에 저장합니다...")
-    with open(processed_file, "w", encoding="utf-8") as processed_json_file:
-        json.dump(text_data, processed_json_file, ensure_ascii=False, indent=2)
+    write_json_file(processed_file, text_data)
     
-    print(f"✅ 데이터 처리 완료. 원본 레코드 수: {len(data)}, 필터링 후 레코드 수: {len(filtered_data)}, 최종 유효 레코드 수: {len(text_data)}")
+    if no_content_count > 0:
+        print(f"⚠️ 의미 있는 내용이 없어 제외된 항목: {no_content_count}개")
+    print(f"✅ 데이터 처리 완료. 원본 레코드 수: {len(data)}, 최종 유효 레코드 수: {len(text_data)}")
     
     # 샘플 데이터 출력
     if text_data:
@@ -696,40 +998,18 @@ def process_and_save_data(data, raw_file, processed_file):
     else:
         print("⚠️ 처리된 데이터가 없습니다!")
 
-    # 에러 보고서 생성 (선택적)
-    error_records = []
-    for item in filtered_data:
-        error_fields = []
-        
-        # XML 파싱 오류 확인
-        for field in ['EE_DOC_DATA_PARSED', 'UD_DOC_DATA_PARSED', 'NB_DOC_DATA_PARSED']:
-            if field in item and item[field] and item[field].get('type') == 'error':
-                error_fields.append({
-                    'field': field.replace('_PARSED', ''),
-                    'error': item[field].get('error', '알 수 없는 오류')
-                })
-        
-        # 오류가 있는 레코드 정보 추가
-        if error_fields:
-            error_records.append({
-                'ITEM_SEQ': item.get('ITEM_SEQ', ''),
-                'ITEM_NAME': item.get('ITEM_NAME', ''),
-                'error_fields': error_fields
-            })
-    
     # 오류 보고서 출력
     if error_records:
         error_report_file = os.path.join(os.path.dirname(processed_file), "error_report.json")
-        with open(error_report_file, "w", encoding="utf-8") as error_file:
-            json.dump(error_records, error_file, ensure_ascii=False, indent=2)
+        write_json_file(error_report_file, error_records)
         print(f"⚠️ {len(error_records)}개의 레코드에서 XML 파싱 오류가 발생했습니다. 자세한 내용은 {error_report_file}을 참조하세요.")
 
 if __name__ == "__main__":
     print("🔎 의약품 허가 정보 데이터를 가져오는 중...")
-    drug_data = fetch_drug_approval_data()
+    drug_data = fetch_drug_approval_data(raw_file=RAW_OUTPUT_FILE)
     
     if drug_data:
         print(f"✅ {len(drug_data)}개의 의약품 레코드를 성공적으로 가져왔습니다.")
-        process_and_save_data(drug_data, RAW_OUTPUT_FILE, PROCESSED_OUTPUT_FILE)
+        process_and_save_data(drug_data, None, PROCESSED_OUTPUT_FILE)
     else:
         print("❌ 데이터를 가져오지 못했습니다. API 연결 및 매개변수를 확인하세요.")
\ No newline at end of file
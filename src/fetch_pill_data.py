@@ -1,8 +1,18 @@
 import os
+import math
+import operator
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from urllib.parse import urlencode
+
+# orjson이 설치되어 있으면 사용 (대용량 JSON 저장이 stdlib json보다 수 배 빠름)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 프로젝트 루트 디렉토리 경로 구하기
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -17,94 +27,151 @@ API_KEY = os.getenv("DATA_PORTAL_API_KEY_DECODED")  # .env 파일에서 API 키
 OUTPUT_JSON_FILE = os.path.join(ROOT_DIR, "data", "raw", "pill_raw_data.json")
 
 # 필요한 필드 목록
-REQUIRED_FIELDS = [
-    "ITEM_SEQ", "ITEM_NAME", "ENTP_SEQ", "ENTP_NAME", "CHART", "ITEM_IMAGE", 
+REQUIRED_FIELDS = (
+    "ITEM_SEQ", "ITEM_NAME", "ENTP_SEQ", "ENTP_NAME", "CHART", "ITEM_IMAGE",
     "PRINT_FRONT", "PRINT_BACK", "DRUG_SHAPE", "COLOR_CLASS1", "COLOR_CLASS2",
-    "LENG_LONG", "LENG_SHORT", "THICK", "CLASS_NO", "CLASS_NAME", "ETC_OTC_NAME", 
+    "LENG_LONG", "LENG_SHORT", "THICK", "CLASS_NO", "CLASS_NAME", "ETC_OTC_NAME",
     "FORM_CODE_NAME", "MARK_CODE_FRONT_ANAL", "MARK_CODE_BACK_ANAL"
-]
+)
+
+# itemgetter로 20개 필드 추출을 C 수준에서 한 번에 수행
+# (누락 키는 ChainMap으로 빈 문자열 기본값 적용)
+_FIELDS_GETTER = operator.itemgetter(*REQUIRED_FIELDS)
+_EMPTY_DEFAULTS = dict.fromkeys(REQUIRED_FIELDS, "")
+
+def project_items(items):
+    """각 항목에서 필요한 필드만 추출한 딕셔너리 리스트 생성"""
+    return [
+        dict(zip(REQUIRED_FIELDS, _FIELDS_GETTER(ChainMap(item, _EMPTY_DEFAULTS))))
+        for item in items
+    ]
+
+def write_records(json_file, records, first_record):
+    """레코드들을 JSON 배열 원소로 이어서 기록하고 first_record 상태를 반환"""
+    for record in records:
+        if first_record:
+            first_record = False
+            json_file.write(b"\n")
+        else:
+            json_file.write(b",\n")
+        if orjson is not None:
+            json_file.write(orjson.dumps(record))
+        else:
+            json_file.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+    return first_record
+
+def get_page(session, page_no, page_size):
+    """한 페이지를 요청해 파싱된 JSON을 반환 (실패 시 None)"""
+    params = {
+        "serviceKey": API_KEY,
+        "pageNo": page_no,
+        "numOfRows": page_size,
+        "type": "json"
+    }
+
+    try:
+        response = session.get(BASE_URL, params=params, timeout=30)
+
+        if response.status_code != 200:
+            print(f"❌ API Request Failed! Status Code: {response.status_code} (page {page_no})")
+            print(f"⚠️ Response Text: {response.text[:200]}")
+            return None
+
+        # 응답 바이트를 orjson으로 직접 파싱 (인코딩 추측/str 변환 생략)
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Error fetching page {page_no}: {e}")
+        return None
+    except (json.JSONDecodeError, ValueError):
+        print(f"❌ JSON Decode Error! Response is not valid JSON (page {page_no}): {response.text[:200]}")
+        return None
+
+def extract_items(data, page_no):
+    """응답 JSON에서 items 리스트를 추출 (없으면 None)"""
+    if not data or "body" not in data or not data["body"].get("items"):
+        print(f"📢 No more data at page {page_no}.")
+        return None
+
+    items = data["body"]["items"]
+
+    # items가 단일 아이템일 경우 리스트로 변환
+    if not isinstance(items, list):
+        items = [items]
+
+    return items
 
 def fetch_pill_data():
-    page_no = 1
     page_size = 100
-    total_data = []
-
-    while True:
-        params = {
-            "serviceKey": API_KEY,
-            "pageNo": page_no,
-            "numOfRows": page_size,
-            "type": "json"
-        }
-
-        # 요청 URL 생성 (디버깅용)
-        request_url = f"{BASE_URL}?{urlencode(params)}"
-        print(f"🔗 Request URL: {request_url}")
-
-        try:
-            response = requests.get(request_url)
-            
-            # ✅ Debugging: API 응답 코드 출력
-            print(f"🔍 API Response Code: {response.status_code}")
-            
-            # HTTP 응답이 200이 아닐 경우 오류 출력
-            if response.status_code != 200:
-                print(f"❌ API Request Failed! Status Code: {response.status_code}")
-                print(f"⚠️ Response Text: {response.text}")
-                break
-            
-            # ✅ Debugging : API 응답 미리보기
-            print(f"🔍 Response Preview: {response.text[:200]}")  # 처음 200자만 출력
-
-            data = response.json()  # JSON 파싱
-            
-            # 응답 구조 확인을 위한 디버깅 출력
-            print(f"🔍 Response Structure Keys: {list(data.keys())}")
-            
-            # 수정: 올바른 경로로 데이터 접근
-            if "body" not in data or not data["body"].get("items"):
-                print(f"📢 No more data at page {page_no}. Stopping fetch.")
-                break
-            
-            items = data["body"]["items"]
-            
-            # 수정: items가 리스트인지 확인 (단일 아이템일 경우 리스트로 변환)
-            if not isinstance(items, list):
-                items = [items]
-            
-            # 필요한 필드만 필터링
-            filtered_items = [
-                {key: item.get(key, "") for key in REQUIRED_FIELDS} for item in items
-            ]
-
-            total_data.extend(filtered_items)
-            print(f"✅ Fetched {len(filtered_items)} records from page {page_no}.")
-            
-            # 데이터를 모두 가져왔는지 확인
-            total_count = data["body"].get("totalCount", 0)
-            if page_no * page_size >= total_count:
-                print(f"📢 Retrieved all data. Total count: {total_count}")
-                break
-
-            page_no += 1
-
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Error fetching data: {e}")
-            break
-        except json.JSONDecodeError:
-            print(f"❌ JSON Decode Error! Response is not valid JSON: {response.text}")
-            break
-        except KeyError as e:
-            print(f"❌ KeyError: {e}. Response structure: {data}")
-            break
-
-    # 절대 경로로 디렉토리 생성
-    output_dir = os.path.dirname(OUTPUT_JSON_FILE)
-    os.makedirs(output_dir, exist_ok=True)
-    with open(OUTPUT_JSON_FILE, "w", encoding="utf-8") as json_file:
-        json.dump(total_data, json_file, ensure_ascii=False, indent=4)
-    
-    print(f"📁 Data saved to {OUTPUT_JSON_FILE}. Total records: {len(total_data)}")
+    total_records = 0
+
+    # keep-alive 세션으로 페이지마다 TCP+TLS 핸드셰이크를 반복하지 않음
+    # (requests.Session은 GET에 한해 스레드 간 공유 가능 - 자체 커넥션 풀 사용)
+    # 커넥션 풀을 스레드 풀 크기에 맞춤 (기본 10이면 16개 동시 요청 시
+    # 초과 연결이 응답마다 버려져 keep-alive 효과가 사라짐)
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # 압축 응답을 명시적으로 요청 (JSON 페이지 전송량 수 배 감소)
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+
+    # 스트리밍 저장: 전체를 리스트에 모았다가 한 번에 직렬화하는 대신
+    # 페이지를 받을 때마다 바로 파일에 기록 (피크 메모리가 페이지 크기 수준)
+    os.makedirs(os.path.dirname(OUTPUT_JSON_FILE), exist_ok=True)
+    json_file = open(OUTPUT_JSON_FILE, "wb")
+    json_file.write(b"[")
+    first_record = True
+
+    try:
+        # 1. 첫 페이지를 동기 요청해 totalCount 파악
+        print(f"🔗 Requesting page 1...")
+        data = get_page(session, 1, page_size)
+        items = extract_items(data, 1)
+        if items is None:
+            print("❌ No data retrieved from first page.")
+            return
+
+        filtered_items = project_items(items)
+        first_record = write_records(json_file, filtered_items, first_record)
+        json_file.flush()
+        total_records += len(filtered_items)
+        print(f"✅ Fetched {len(filtered_items)} records from page 1.")
+
+        total_count = data["body"].get("totalCount", 0)
+        n_pages = math.ceil(total_count / page_size) if total_count else 1
+        if n_pages > 1:
+            print(f"📊 Total count: {total_count}, fetching pages 2..{n_pages} in parallel...")
+
+            # 2. 나머지 페이지는 스레드 풀로 동시에 요청 (순수 네트워크 대기 작업)
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                futures = {
+                    page_no: executor.submit(get_page, session, page_no, page_size)
+                    for page_no in range(2, n_pages + 1)
+                }
+
+                # 페이지 순서를 보존하며 수거해 기록
+                for page_no in range(2, n_pages + 1):
+                    data = futures[page_no].result()
+                    items = extract_items(data, page_no)
+                    if items is None:
+                        continue
+
+                    filtered_items = project_items(items)
+                    first_record = write_records(json_file, filtered_items, first_record)
+                    json_file.flush()
+                    total_records += len(filtered_items)
+                    print(f"✅ Fetched {len(filtered_items)} records from page {page_no}.")
+
+        print(f"📢 Retrieved all data. Total count: {total_count}")
+
+    finally:
+        json_file.write(b"\n]")
+        json_file.close()
+
+    print(f"📁 Data saved to {OUTPUT_JSON_FILE}. Total records: {total_records}")
 
 if __name__ == "__main__":
     fetch_pill_data()
\ No newline at end of file
@@ -1,12 +1,48 @@
 import json
+import re
+import math
 import aiohttp
 import asyncio
 import os
 import time
+import queue
 import random
+import sqlite3
+import logging
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from tqdm import tqdm  # 프로그레스 바
-from bs4 import BeautifulSoup  # HTML 파싱
+
+# orjson이 설치되어 있으면 사용 (대용량 JSON 로드/저장이 stdlib json보다 수 배 빠름)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson이 설치되어 있으면 샘플링 시 스트리밍 파싱 사용 (전체 로드 불필요)
+# (C 기반 yajl2_c 백엔드가 있으면 우선 사용)
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+# uvloop이 설치되어 있으면 기본 이벤트 루프로 사용 (수천 개의 소규모 태스크
+# 처리량이 2~4배 향상, Linux/macOS 전용이므로 없으면 기본 루프 사용)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# 등록 여부 판단용 패턴 - 응답 HTML에서 두 가지만 확인하면 되므로 DOM을
+# 만들지 않고 바이트 수준 검사로 판별 (응답 본문은 UTF-8이므로 str 디코드
+# 없이 미리 인코딩해 둔 패턴을 바로 검색)
+_NOT_FOUND_B = "조회 결과가 없습니다.".encode("utf-8")
+_RE_REGISTERED_B = re.compile(rb'class="dr_table2"[\s\S]{0,20000}?getItemDetail\?itemSeq=')
 
 # 📌 파일 경로 설정
 DATA_DIR = "data"
@@ -14,6 +50,7 @@ PROCESSED_DIR = os.path.join(DATA_DIR, "processed")
 RAW_DIR = os.path.join(DATA_DIR, "raw")
 FILTERED_DIR = os.path.join(DATA_DIR, "filtered")
 LOGS_DIR = os.path.join(DATA_DIR, "logs")  # 로그 디렉토리 추가
+CACHE_DIR = os.path.join(DATA_DIR, "cache")  # 영속 캐시 디렉토리
 
 DRUG_FILE = os.path.join(PROCESSED_DIR, "drug_approval_data_processed.json")
 PILL_FILE = os.path.join(RAW_DIR, "pill_raw_data.json")
@@ -22,31 +59,82 @@ FILTERED_DRUG_FILE = os.path.join(FILTERED_DIR, "filtered_drug_approvals.json")
 FILTERED_PILL_FILE = os.path.join(FILTERED_DIR, "filtered_pill_data.json")
 
 # 📌 필요한 디렉토리 생성
-for directory in [FILTERED_DIR, LOGS_DIR]:
+for directory in [FILTERED_DIR, LOGS_DIR, CACHE_DIR]:
     os.makedirs(directory, exist_ok=True)
 
+# ITEM_SEQ -> 등록 여부 영속 캐시 (이 기간 안의 결과는 HTTP 없이 재사용)
+STATUS_CACHE_FILE = os.path.join(CACHE_DIR, "status_cache.db")
+STATUS_CACHE_TTL = 7 * 86400  # 7일
+
 # 📌 로깅 설정
-def setup_logger():
-    """로깅 설정 및 로그 파일 경로 반환"""
+# 파일 쓰기는 QueueListener가 백그라운드 스레드에서 수행 - 이벤트 루프
+# 스레드는 큐에 레코드만 넣으므로 요청당 open/write 시스템콜이 사라짐
+logger = logging.getLogger(__name__)
+_log_listener = None
+
+def setup_logger(verbose=False):
+    """로깅 설정 및 로그 파일 경로 반환 (백그라운드 큐 리스너 시작)
+
+    verbose=False(기본)면 INFO 레벨이라 항목 단위 debug 로그는 포매팅조차
+    건너뛰어 로그 지점 비용이 0에 가깝습니다.
+    """
+    global _log_listener
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(LOGS_DIR, f"filter_process_{timestamp}.log")
-    
-    with open(log_file, "w", encoding="utf-8") as f:
-        f.write(f"=== 필터링 프로세스 로그 ({timestamp}) ===\n\n")
-    
+
+    file_handler = logging.FileHandler(log_file, mode="w", encoding="utf-8")
+    file_handler.setFormatter(
+        logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    )
+
+    log_queue = queue.SimpleQueue()
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.addHandler(QueueHandler(log_queue))
+
+    _log_listener = QueueListener(log_queue, file_handler)
+    _log_listener.start()
+
+    logger.info("=== 필터링 프로세스 로그 (%s) ===", timestamp)
     print(f"📝 로그 파일 생성: {log_file}")
     return log_file
 
-def log_message(message, log_file, print_to_console=True):
-    """로그 메시지 기록"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"[{timestamp}] {message}"
-    
+def stop_logger():
+    """큐에 남은 로그를 모두 기록하고 리스너 종료"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+def log_message(message, log_file=None, print_to_console=True):
+    """로그 메시지 기록 (파일 쓰기는 백그라운드 리스너가 담당)"""
     if print_to_console:
-        print(log_entry)
-    
-    with open(log_file, "a", encoding="utf-8") as f:
-        f.write(log_entry + "\n")
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{timestamp}] {message}")
+
+    logger.info(message)
+
+def _reservoir_sample(iterable, k):
+    """
+    스트림에서 k개를 균등 확률로 샘플링 (Algorithm L).
+
+    전체 크기를 모른 채 한 번의 순회로 동작하며, 건너뛸 개수를 기하 분포로
+    계산하므로 항목마다 난수를 뽑는 고전 방식보다 난수 호출이 O(k log(n/k))로
+    줄어듭니다. 메모리는 O(k)만 사용합니다.
+    """
+    iterator = iter(iterable)
+    reservoir = list(islice(iterator, k))
+    if len(reservoir) < k:
+        return reservoir
+
+    w = math.exp(math.log(random.random()) / k)
+    while True:
+        skip = math.floor(math.log(random.random()) / math.log(1.0 - w))
+        item = next(islice(iterator, skip, skip + 1), None)
+        if item is None:
+            return reservoir
+        reservoir[random.randrange(k)] = item
+        w *= math.exp(math.log(random.random()) / k)
 
 # ✅ 1. JSON에서 데이터 로드 (+ 샘플 기능)
 def load_json(file_path, log_file, sample_size=None):
@@ -54,8 +142,18 @@ def load_json(file_path, log_file, sample_size=None):
     log_message(f"📂 JSON 파일 로드 중: {file_path}", log_file)
     
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # 샘플링 시: ijson으로 스트리밍하며 저수지 샘플링 - 전체 파일을
+        # 메모리에 올리지 않고 O(sample_size) 메모리로 균등 샘플 추출
+        if sample_size and ijson is not None:
+            with open(file_path, "rb") as f:
+                data = _reservoir_sample(ijson.items(f, "item"), sample_size)
+            log_message(f"🔍 샘플링 적용: {len(data)}개 데이터 선택됨", log_file)
+            log_message(f"🔢 총 {len(data)}개의 항목 로드 완료", log_file)
+            return data
+
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
         
         if sample_size and len(data) > sample_size:
             data = random.sample(data, sample_size)
@@ -67,94 +165,213 @@ def load_json(file_path, log_file, sample_size=None):
         log_message(f"❌ 파일 로드 중 오류 발생: {e}", log_file)
         return []
 
+def save_json(file_path, data):
+    """필터링 결과 JSON 저장 (orjson 사용 가능 시 바이트 직렬화)"""
+    if orjson is not None:
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+def open_status_cache(cache_file=STATUS_CACHE_FILE):
+    """조회 결과 영속 캐시(sqlite)를 엽니다. 실패 시 None (캐시 없이 동작)."""
+    try:
+        conn = sqlite3.connect(cache_file)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS status_cache (item_seq TEXT PRIMARY KEY, status INTEGER NOT NULL, ts INTEGER NOT NULL)"
+        )
+        return conn
+    except sqlite3.Error as e:
+        print(f"⚠️ 상태 캐시를 열 수 없어 캐시 없이 진행합니다: {e}")
+        return None
+
+def load_fresh_statuses(conn, ttl=STATUS_CACHE_TTL):
+    """TTL 이내의 캐시 항목을 {ITEM_SEQ: 등록 여부} 딕셔너리로 반환"""
+    try:
+        rows = conn.execute(
+            "SELECT item_seq, status FROM status_cache WHERE ts >= ?",
+            (int(time.time()) - ttl,),
+        ).fetchall()
+        return {seq: bool(status) for seq, status in rows}
+    except sqlite3.Error as e:
+        print(f"⚠️ 상태 캐시 조회 실패: {e}")
+        return {}
+
+def save_statuses(conn, statuses):
+    """새로 확인한 {ITEM_SEQ: 등록 여부}를 일괄 기록"""
+    if not statuses:
+        return
+    try:
+        now = int(time.time())
+        conn.executemany(
+            "INSERT OR REPLACE INTO status_cache (item_seq, status, ts) VALUES (?, ?, ?)",
+            [(seq, int(valid), now) for seq, valid in statuses.items()],
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"⚠️ 상태 캐시 기록 실패: {e}")
+
+# 허가정보/낱알정보 두 패스가 공유하는 ITEM_SEQ별 조회 결과 캐시.
+# 값은 (is_valid, status)를 담는 Future로, 같은 ITEM_SEQ에 대한 동시 조회를
+# 하나의 HTTP 요청으로 병합하고 두 번째 패스의 중복 항목은 즉시 응답함.
+_status_cache = {}
+
+# 이번 실행에서 새로 확인된 확정 결과 (종료 시 영속 캐시에 일괄 기록)
+_new_statuses = {}
+
+async def _check_status(session, item_seq):
+    """nedrug에 실제 HTTP 요청을 보내 (등록 여부, 상태 코드)를 반환"""
+    url = f"https://nedrug.mfds.go.kr/searchDrug?searchYn=true&itemSeq={item_seq}"
+
+    async with session.get(url, timeout=10) as response:
+        # 본문 전체를 str로 디코드하지 않고 바이트 그대로 검사
+        body = await response.read()
+
+    # ❌ "조회 결과가 없습니다." → 무조건 미등록
+    # (대부분의 응답이 이 분기에서 끝나므로 디코드/파싱 모두 생략)
+    if body.find(_NOT_FOUND_B) != -1:
+        return False, "NOT_REGISTERED"
+
+    # ✅ 등록된 경우: dr_table2 테이블 안에 `getItemDetail?itemSeq=` 링크 존재
+    if _RE_REGISTERED_B.search(body):
+        return True, "REGISTERED"
+
+    return False, "UNKNOWN_RESPONSE"
+
 # ✅ 2. 비동기 요청 함수 (필터링 기준 개선)
 async def fetch_status(session, item, log_file, request_index=None, total_requests=None):
     """식약처 웹사이트에서 ITEM_SEQ 등록 여부를 확인하는 비동기 함수"""
     item_seq = item.get("ITEM_SEQ")
     if not item_seq:
-        log_message(f"⚠️ ITEM_SEQ 없음, 건너뜀", log_file, False)
+        logger.debug("⚠️ ITEM_SEQ 없음, 건너뜀")
         return item, False, "ITEM_SEQ_MISSING"
-    
-    url = f"https://nedrug.mfds.go.kr/searchDrug?searchYn=true&itemSeq={item_seq}"
-    headers = {"User-Agent": "Mozilla/5.0"}
 
     progress_info = f"[{request_index}/{total_requests}]" if request_index and total_requests else ""
     item_name = item.get("ITEM_NAME", "이름 없음")
-    log_message(f"🔍 {progress_info} 확인 중: {item_name} (ITEM_SEQ: {item_seq})", log_file, False)
-    
+
+    # 캐시 확인 - 진행 중인 동일 조회가 있으면 그 결과를 기다림
+    cached_future = _status_cache.get(item_seq)
+    if cached_future is not None:
+        is_valid, status = await asyncio.shield(cached_future)
+        logger.debug("♻️ %s 캐시 적중: %s (ITEM_SEQ: %s) -> %s", progress_info, item_name, item_seq, status)
+        return item, is_valid, "CACHED"
+
+    future = asyncio.get_running_loop().create_future()
+    _status_cache[item_seq] = future
+
     try:
-        async with session.get(url, headers=headers, timeout=10) as response:
-            html = await response.text()
-            soup = BeautifulSoup(html, "html.parser")
-
-            # ❌ "조회 결과가 없습니다." → 무조건 미등록
-            if soup.find("span", string="조회 결과가 없습니다."):
-                log_message(f"❌ {progress_info} 미등록: {item_name} (ITEM_SEQ: {item_seq})", log_file, False)
-                return item, False, "NOT_REGISTERED"
-
-            # ✅ 등록된 경우: <table> 내부에 `getItemDetail?itemSeq=` 포함 여부 확인
-            result_table = soup.find("table", class_="dr_table2")
-            if result_table and result_table.find("a", href=lambda x: x and "getItemDetail?itemSeq=" in x):
-                log_message(f"✅ {progress_info} 등록됨: {item_name} (ITEM_SEQ: {item_seq})", log_file, False)
-                return item, True, "REGISTERED"
-
-            log_message(f"⚠️ {progress_info} 예외 상황 발생 (정확한 등록 여부 확인 불가)", log_file, False)
-            return item, False, "UNKNOWN_RESPONSE"
-    
+        is_valid, status = await _check_status(session, item_seq)
     except Exception as e:
-        log_message(f"⚠️ {progress_info} 요청 오류 발생: {str(e)} (ITEM_SEQ: {item_seq})", log_file, False)
+        # 일시적 오류는 캐시하지 않음 (같은 ITEM_SEQ 재조회 시 재시도)
+        _status_cache.pop(item_seq, None)
+        future.set_result((False, "ERROR"))
+        logger.debug("⚠️ %s 요청 오류 발생: %s (ITEM_SEQ: %s)", progress_info, e, item_seq)
         return item, False, f"ERROR: {str(e)}"
 
+    future.set_result((is_valid, status))
+    if status in ("REGISTERED", "NOT_REGISTERED"):
+        _new_statuses[item_seq] = is_valid
+    if status == "UNKNOWN_RESPONSE":
+        # 판별 불가 응답도 재시도 대상으로 남겨둠
+        _status_cache.pop(item_seq, None)
+        logger.debug("⚠️ %s 예외 상황 발생 (정확한 등록 여부 확인 불가, ITEM_SEQ: %s)", progress_info, item_seq)
+    elif is_valid:
+        logger.debug("✅ %s 등록됨: %s (ITEM_SEQ: %s)", progress_info, item_name, item_seq)
+    else:
+        logger.debug("❌ %s 미등록: %s (ITEM_SEQ: %s)", progress_info, item_name, item_seq)
+
+    return item, is_valid, status
+
 # ✅ 3. 비동기 방식으로 데이터 필터링
-async def filter_data_async(data, batch_size=10, log_file=None):
-    """비동기 방식으로 데이터 필터링"""
+async def filter_data_async(session, data, concurrency=50, log_file=None):
+    """
+    비동기 방식으로 데이터 필터링 (세션은 호출자가 관리)
+
+    고정 크기 배치는 배치마다 가장 느린 응답을 기다려 파이프라인이 비는
+    구간이 생기므로, 세마포어로 동시 요청 수만 제한하고 전체를 한 번에
+    제출해 완료되는 대로 수거합니다.
+    """
     valid_data = []
     total_items = len(data)
     
-    log_message(f"🚀 총 {total_items}개 항목 필터링 시작 (배치 크기: {batch_size})", log_file)
+    log_message(f"🚀 총 {total_items}개 항목 필터링 시작 (동시 요청 수: {concurrency})", log_file)
     pbar = tqdm(total=total_items, desc="필터링 진행 중")
 
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for idx, item in enumerate(data):
-            request_index = idx + 1
-            tasks.append(fetch_status(session, item, log_file, request_index, total_items))
-            
-            if len(tasks) >= batch_size:
-                results = await asyncio.gather(*tasks)
-                valid_data.extend([item for item, is_valid, _ in results if is_valid])
-                tasks = []
-                pbar.update(batch_size)
-
-        if tasks:
-            results = await asyncio.gather(*tasks)
-            valid_data.extend([item for item, is_valid, _ in results if is_valid])
-            pbar.update(len(tasks))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded_fetch(item, request_index):
+        async with semaphore:
+            return await fetch_status(session, item, log_file, request_index, total_items)
+
+    tasks = [
+        asyncio.create_task(bounded_fetch(item, idx + 1))
+        for idx, item in enumerate(data)
+    ]
+
+    for task in asyncio.as_completed(tasks):
+        item, is_valid, _ = await task
+        if is_valid:
+            valid_data.append(item)
+        pbar.update(1)
 
     pbar.close()
     log_message(f"✅ 필터링 완료! 등록된 항목 수: {len(valid_data)}/{total_items}", log_file)
     return valid_data
 
 # ✅ 4. 실행 (샘플링 적용 가능)
-async def main(sample_size=None):
-    log_file = setup_logger()
+async def main(sample_size=None, verbose=False):
+    log_file = setup_logger(verbose)
     start_time = time.time()
 
     log_message("🚀 데이터 필터링 프로세스 시작", log_file)
 
-    log_message("\n🔎 허가정보 데이터 필터링 시작...", log_file)
-    drug_data = load_json(DRUG_FILE, log_file, sample_size)
-    filtered_drug_data = await filter_data_async(drug_data, batch_size=10, log_file=log_file)
-    with open(FILTERED_DRUG_FILE, "w", encoding="utf-8") as f:
-        json.dump(filtered_drug_data, f, ensure_ascii=False, indent=4)
+    # 영속 캐시에서 TTL 이내의 이전 결과를 메모리 캐시에 미리 채워
+    # 해당 ITEM_SEQ는 HTTP 요청 자체를 건너뜀
+    status_db = open_status_cache()
+    if status_db is not None:
+        loop = asyncio.get_running_loop()
+        fresh = load_fresh_statuses(status_db)
+        for seq, valid in fresh.items():
+            future = loop.create_future()
+            future.set_result((valid, "REGISTERED" if valid else "NOT_REGISTERED"))
+            _status_cache[seq] = future
+        if fresh:
+            log_message(f"♻️ 영속 캐시에서 {len(fresh)}개 ITEM_SEQ 결과 재사용", log_file)
+
+    # 두 필터링 패스가 같은 호스트(nedrug)를 대상으로 하므로 세션을 하나만
+    # 만들어 공유 - keep-alive로 TCP+TLS 핸드셰이크를 패스 간에 재사용
+    # 단일 호스트 크롤이므로 per-host 제한을 전체 제한과 같게 두고,
+    # keep-alive 유지 시간을 늘려 패스 사이에도 연결이 살아 있게 함
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=64,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+        ttl_dns_cache=600,
+    )
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": "Mozilla/5.0"}
+    ) as session:
+        log_message("\n🔎 허가정보 데이터 필터링 시작...", log_file)
+        drug_data = load_json(DRUG_FILE, log_file, sample_size)
+        filtered_drug_data = await filter_data_async(session, drug_data, log_file=log_file)
+        save_json(FILTERED_DRUG_FILE, filtered_drug_data)
+
+        log_message("\n🔎 낱알정보 데이터 필터링 시작...", log_file)
+        pill_data = load_json(PILL_FILE, log_file, sample_size)
+        filtered_pill_data = await filter_data_async(session, pill_data, log_file=log_file)
+        save_json(FILTERED_PILL_FILE, filtered_pill_data)
 
-    log_message("\n🔎 낱알정보 데이터 필터링 시작...", log_file)
-    pill_data = load_json(PILL_FILE, log_file, sample_size)
-    filtered_pill_data = await filter_data_async(pill_data, batch_size=15, log_file=log_file)
-    with open(FILTERED_PILL_FILE, "w", encoding="utf-8") as f:
-        json.dump(filtered_pill_data, f, ensure_ascii=False, indent=4)
+    # 이번 실행에서 새로 확인한 결과를 영속 캐시에 반영
+    if status_db is not None:
+        save_statuses(status_db, _new_statuses)
+        status_db.close()
 
     log_message("✅ 전체 필터링 완료!", log_file)
+    stop_logger()
 
 # 비동기 실행 (샘플 개수 지정 가능)
 if __name__ == "__main__":